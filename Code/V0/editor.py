@@ -523,6 +523,7 @@ class ForbiddenScribeEditor:
                         # Update the pending passage with AI response
                         passage.ai_response = result.text
                         passage.text = result.text
+                        passage.revision += 1
                         passage.model = result.model
                         passage.pending = False
                         # Log creation
@@ -541,6 +542,7 @@ class ForbiddenScribeEditor:
                             # Mark as error but keep the passage
                             passage.pending = False
                             passage.text = f"[ERROR: {result.error}]\n\n{passage.user_entry}"
+                            passage.revision += 1
                         self.state.status_message = f"Error: {result.error}"
 
                 elif item["type"] == "passage_update":
@@ -567,6 +569,7 @@ class ForbiddenScribeEditor:
                         if passage:
                             passage.pending = False
                             passage.text = f"[ERROR: {item['error']}]\n\n{passage.user_entry}"
+                            passage.revision += 1
                     self.state.status_message = f"Error: {item['error'][:50]}"
 
                 self.state.processing = False
@@ -929,18 +932,26 @@ class ForbiddenScribeEditor:
                 curses.napms(50)
                 continue
 
-            # Handle global keys first
-            if self._handle_global_keys(key):
-                continue
-
-            # Handle mode-specific keys
-            if self.state.mode == EditorMode.INPUT:
-                self._handle_input_mode_keys(key)
-            elif self.state.mode == EditorMode.PASSAGES:
-                self._handle_passages_mode_keys(key)
-            elif self.state.mode == EditorMode.EDIT_PASSAGE:
-                self._handle_edit_mode_keys(key)
-            elif self.state.mode in (EditorMode.MENU_LEFT, EditorMode.MENU_RIGHT):
-                self._handle_menu_keys(key)
+            # Drain every pending key before the next redraw so a
+            # paste or key-repeat burst costs one frame, not one per key
+            while key != -1 and self.state.running:
+                # Handle global keys first
+                if not self._handle_global_keys(key):
+                    # Handle mode-specific keys
+                    if self.state.mode == EditorMode.INPUT:
+                        self._handle_input_mode_keys(key)
+                    elif self.state.mode == EditorMode.PASSAGES:
+                        self._handle_passages_mode_keys(key)
+                    elif self.state.mode == EditorMode.EDIT_PASSAGE:
+                        self._handle_edit_mode_keys(key)
+                    elif self.state.mode in (
+                        EditorMode.MENU_LEFT, EditorMode.MENU_RIGHT
+                    ):
+                        self._handle_menu_keys(key)
+
+                try:
+                    key = self.stdscr.getch()
+                except curses.error:
+                    key = -1
 
         self.logger.info("Application shutdown")
@@ -2,13 +2,17 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
 import uuid
 
 
-@dataclass
-class PassageAuditEntry:
-    """Single audit log entry for passage changes."""
+class PassageAuditEntry(NamedTuple):
+    """Single audit log entry for passage changes.
+
+    A NamedTuple rather than a dataclass: entries are immutable records
+    that accumulate in long append-heavy histories, so the tuple layout
+    keeps them compact and makes serialization cheap.
+    """
 
     timestamp: str
     operation: str  # "create", "edit", "reroll", "fix", "condense", "expand"
@@ -18,13 +22,7 @@ class PassageAuditEntry:
 
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
-        return {
-            "timestamp": self.timestamp,
-            "operation": self.operation,
-            "model": self.model,
-            "previous_text": self.previous_text,
-            "new_text": self.new_text,
-        }
+        return self._asdict()
 
     @classmethod
     def from_dict(cls, data: dict) -> "PassageAuditEntry":
@@ -48,13 +46,16 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Passage:
     """Immutable user/AI pairing with editable text overlay.
 
     The user_entry and ai_response fields are immutable records of the
     original submission. The text field is the current editable version
     that can be modified by the user or AI agents.
+
+    Slotted to keep per-passage memory small for long documents; equality
+    is identity-based on the unique id rather than field-by-field.
     """
 
     id: str = field(default_factory=_generate_id)
@@ -67,6 +68,17 @@ class Passage:
     manual_edited: bool = False
     pending: bool = False  # Waiting for AI response
     audit_log: list[PassageAuditEntry] = field(default_factory=list)
+    # Monotonic change counter for the display layer: bumped whenever
+    # text changes so redraw gates can compare one int instead of the
+    # text itself (length alone misses same-length edits). Runtime-only;
+    # never serialized.
+    revision: int = field(default=0, repr=False)
+    # Display-layout cache: wrapped lines keyed by render width, plus
+    # the text object they were computed from. Populated by the UI on
+    # first draw and cleared whenever the text changes, so wrapping
+    # happens once per edit instead of once per frame. Never serialized.
+    _wrap_cache: dict = field(default_factory=dict, repr=False)
+    _wrap_src: Optional[str] = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize text to ai_response or user_entry if not set."""
@@ -76,6 +88,12 @@ class Passage:
             elif self.user_entry:
                 self.text = self.user_entry
 
+    def __eq__(self, other: object) -> bool:
+        """Compare passages by unique id."""
+        if not isinstance(other, Passage):
+            return NotImplemented
+        return self.id == other.id
+
     def update_text(
         self,
         new_text: str,
@@ -98,6 +116,9 @@ class Passage:
         )
         self.audit_log.append(entry)
         self.text = new_text
+        self.revision += 1
+        self._wrap_cache.clear()
+        self._wrap_src = None
         if operation == "manual_edit":
             self.manual_edited = True
 
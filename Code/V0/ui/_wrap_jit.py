@@ -0,0 +1,75 @@
+"""Optional Numba-accelerated wrap kernel for very large lines.
+
+Wrapping a pasted multi-kilobyte line by cell width is a tight Python
+loop. When numba and numpy are installed, the chunk-boundary scan runs
+as a compiled kernel instead; when they are not, HAVE_JIT is False and
+callers keep the pure-Python path. Nothing here is required for
+correctness.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_JIT = True
+except ImportError:
+    np = None
+    njit = None
+    HAVE_JIT = False
+
+# Minimum line length (in chars) before the kernel is worth the
+# array-conversion overhead
+JIT_THRESHOLD = 4096
+
+
+if HAVE_JIT:
+
+    @njit(cache=True)
+    def _wrap_boundaries(widths, content_width, out_starts):  # pragma: no cover
+        """Fill out_starts with chunk start indices.
+
+        Args:
+            widths: int32 array of per-character cell widths.
+            content_width: Cells available per display row.
+            out_starts: Preallocated int32 output array.
+
+        Returns:
+            Number of chunks written.
+        """
+        out_starts[0] = 0
+        count = 1
+        cells = 0
+        for i in range(widths.shape[0]):
+            width = widths[i]
+            if cells + width > content_width and cells > 0:
+                out_starts[count] = i
+                count += 1
+                cells = 0
+            cells += width
+        return count
+
+    def wrap_starts(widths: "np.ndarray", content_width: int) -> list[int]:
+        """Compute chunk start indices for a line.
+
+        Args:
+            widths: int32 array of per-character cell widths.
+            content_width: Cells available per display row.
+
+        Returns:
+            List of character indices at which chunks begin.
+        """
+        out = np.empty(widths.shape[0] + 1, dtype=np.int32)
+        count = _wrap_boundaries(widths, np.int32(content_width), out)
+        return out[:count].tolist()
+
+    def warm_up() -> None:
+        """Trigger kernel compilation outside the interactive path."""
+        wrap_starts(np.ones(8, dtype=np.int32), 4)
+
+else:
+
+    def wrap_starts(widths, content_width):
+        """Unavailable without numba; callers must check HAVE_JIT."""
+        raise RuntimeError("numba is not installed")
+
+    def warm_up() -> None:
+        """No-op when numba is not installed."""
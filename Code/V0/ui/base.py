@@ -1,6 +1,7 @@
 """Base UI utilities and color definitions."""
 
 import curses
+import textwrap
 from enum import IntEnum
 from typing import Optional
 
@@ -31,31 +32,63 @@ class ColorPair(IntEnum):
     INDICATOR_6 = 17  # Magenta
 
 
+# Precomputed curses attribute ints, populated by setup_colors().
+# curses.color_pair() is a Python->C call; looking the int up here is
+# cheaper on per-line draw paths.
+COLOR_ATTR: dict[int, int] = {}
+
+
+# Singleton 1-char strings for printable ASCII, indexed by key code.
+# Non-printable codes map to None. Indexing this table replaces the
+# range check plus chr() allocation on every keystroke, which matters
+# on key-repeat and paste streams.
+PRINTABLE_CHARS: tuple[Optional[str], ...] = tuple(
+    chr(i) if 32 <= i <= 126 else None for i in range(128)
+)
+
+
+# (pair, foreground, background) for every ColorPair, in one place so the
+# full gradient set is defined exactly once. Light text on default (dark)
+# background for readability; -1 is the terminal default background.
+_PAIR_SPEC: tuple[tuple[int, int, int], ...] = (
+    (ColorPair.HEADER, curses.COLOR_CYAN, -1),
+    (ColorPair.FOOTER, curses.COLOR_WHITE, -1),
+    (ColorPair.BORDER_FOCUS, curses.COLOR_GREEN, -1),
+    (ColorPair.BORDER_INPUT, curses.COLOR_YELLOW, -1),
+    (ColorPair.BORDER_DIM, curses.COLOR_WHITE, -1),
+    (ColorPair.SELECTED, curses.COLOR_GREEN, -1),
+    (ColorPair.MENU_BG, curses.COLOR_CYAN, -1),
+    (ColorPair.MENU_SELECT, curses.COLOR_BLACK, curses.COLOR_CYAN),
+    (ColorPair.ERROR, curses.COLOR_RED, -1),
+    (ColorPair.WARNING, curses.COLOR_YELLOW, -1),
+    (ColorPair.DEBUG, curses.COLOR_MAGENTA, -1),
+    # Gradient colors for passage indicators
+    (ColorPair.INDICATOR_1, curses.COLOR_RED, -1),
+    (ColorPair.INDICATOR_2, curses.COLOR_YELLOW, -1),
+    (ColorPair.INDICATOR_3, curses.COLOR_GREEN, -1),
+    (ColorPair.INDICATOR_4, curses.COLOR_CYAN, -1),
+    (ColorPair.INDICATOR_5, curses.COLOR_BLUE, -1),
+    (ColorPair.INDICATOR_6, curses.COLOR_MAGENTA, -1),
+)
+
+
 def setup_colors() -> None:
-    """Initialize curses color pairs for dark terminal backgrounds."""
+    """Initialize curses color pairs for dark terminal backgrounds.
+
+    Safe to call more than once; pairs are only initialized on the
+    first call.
+    """
     curses.start_color()
     curses.use_default_colors()
 
-    # Use light text on default (dark) background for readability
-    curses.init_pair(ColorPair.HEADER, curses.COLOR_CYAN, -1)
-    curses.init_pair(ColorPair.FOOTER, curses.COLOR_WHITE, -1)
-    curses.init_pair(ColorPair.BORDER_FOCUS, curses.COLOR_GREEN, -1)
-    curses.init_pair(ColorPair.BORDER_INPUT, curses.COLOR_YELLOW, -1)
-    curses.init_pair(ColorPair.BORDER_DIM, curses.COLOR_WHITE, -1)
-    curses.init_pair(ColorPair.SELECTED, curses.COLOR_GREEN, -1)
-    curses.init_pair(ColorPair.MENU_BG, curses.COLOR_CYAN, -1)
-    curses.init_pair(ColorPair.MENU_SELECT, curses.COLOR_BLACK, curses.COLOR_CYAN)
-    curses.init_pair(ColorPair.ERROR, curses.COLOR_RED, -1)
-    curses.init_pair(ColorPair.WARNING, curses.COLOR_YELLOW, -1)
-    curses.init_pair(ColorPair.DEBUG, curses.COLOR_MAGENTA, -1)
+    if COLOR_ATTR:
+        return
 
-    # Gradient colors for passage indicators
-    curses.init_pair(ColorPair.INDICATOR_1, curses.COLOR_RED, -1)
-    curses.init_pair(ColorPair.INDICATOR_2, curses.COLOR_YELLOW, -1)
-    curses.init_pair(ColorPair.INDICATOR_3, curses.COLOR_GREEN, -1)
-    curses.init_pair(ColorPair.INDICATOR_4, curses.COLOR_CYAN, -1)
-    curses.init_pair(ColorPair.INDICATOR_5, curses.COLOR_BLUE, -1)
-    curses.init_pair(ColorPair.INDICATOR_6, curses.COLOR_MAGENTA, -1)
+    for pair, fg, bg in _PAIR_SPEC:
+        curses.init_pair(pair, fg, bg)
+
+    # Cache the attribute ints now that the pairs exist
+    COLOR_ATTR.update({cp: curses.color_pair(cp) for cp in ColorPair})
 
 
 def wrap_text(text: str, width: int, word_wrap: bool = True) -> list[str]:
@@ -72,43 +105,48 @@ def wrap_text(text: str, width: int, word_wrap: bool = True) -> list[str]:
     if width <= 0:
         return []
 
-    lines = text.split("\n")
+    # Most text is a single line; skip the split allocation for that case
+    if "\n" not in text:
+        lines = [text]
+    else:
+        lines = text.split("\n")
     wrapped: list[str] = []
 
+    # ASCII text (the common case for LLM output) can use the stdlib
+    # wrapper, whose scanning runs on precompiled regexes instead of a
+    # per-word Python loop
+    use_textwrap = word_wrap and text.isascii()
+
     for line in lines:
         if len(line) <= width:
             wrapped.append(line)
+        elif use_textwrap:
+            wrapped.extend(
+                textwrap.wrap(
+                    line, width,
+                    break_long_words=True,
+                    break_on_hyphens=False,
+                )
+            )
         elif word_wrap:
-            # Word-based wrapping
-            current = ""
-            words = line.split(" ")
-            for word in words:
-                if not current:
-                    # First word on line
-                    if len(word) <= width:
-                        current = word
-                    else:
-                        # Word too long, hard wrap it
-                        while len(word) > width:
-                            wrapped.append(word[:width])
-                            word = word[width:]
-                        current = word
-                elif len(current) + 1 + len(word) <= width:
-                    # Word fits on current line
-                    current += " " + word
+            # Word-based wrapping: break at the last space inside each
+            # width-sized window. rfind is a bounded C-level scan, so
+            # the work per emitted line is capped by width no matter
+            # how long the input line is (no whitespace-free
+            # pathological case)
+            i = 0
+            n = len(line)
+            while n - i > width:
+                break_idx = line.rfind(" ", i, i + width + 1)
+                if break_idx <= i:
+                    # No space in range: hard break
+                    wrapped.append(line[i:i + width])
+                    i += width
                 else:
-                    # Word doesn't fit, start new line
-                    wrapped.append(current)
-                    if len(word) <= width:
-                        current = word
-                    else:
-                        # Word too long, hard wrap it
-                        while len(word) > width:
-                            wrapped.append(word[:width])
-                            word = word[width:]
-                        current = word
-            if current:
-                wrapped.append(current)
+                    wrapped.append(line[i:break_idx])
+                    i = break_idx + 1
+            if i < n:
+                wrapped.append(line[i:])
         else:
             # Hard wrap at width
             while len(line) > width:
@@ -178,8 +216,11 @@ def draw_box(
         color_pair: Color pair for the border.
     """
     try:
-        window.attron(curses.color_pair(color_pair))
+        attr = COLOR_ATTR.get(color_pair)
+        if attr is None:
+            attr = curses.color_pair(color_pair)
+        window.attron(attr)
         window.border()
-        window.attroff(curses.color_pair(color_pair))
+        window.attroff(attr)
     except curses.error:
         pass
@@ -6,7 +6,7 @@ import time
 from collections import deque
 from typing import Optional
 
-from ui.base import ColorPair, draw_box, safe_addstr, wrap_text
+from ui.base import COLOR_ATTR, ColorPair, draw_box, safe_addstr, wrap_text
 
 
 class DebugPanel:
@@ -43,6 +43,15 @@ class DebugPanel:
         _, width = self.window.getmaxyx()
         content_width = max(10, width - 4)
 
+        # Fast path: most log records are a single line
+        if "\n" not in text:
+            wrapped = wrap_text(text, content_width)
+            for i, wrapped_line in enumerate(wrapped if wrapped else [""]):
+                self.lines.append((wrapped_line, level if i == 0 else ""))
+            if self.auto_scroll:
+                self._scroll_to_bottom()
+            return
+
         for line in text.split("\n"):
             # Wrap long lines
             wrapped = wrap_text(line, content_width)
@@ -152,11 +161,11 @@ class DebugPanel:
         """
         level_upper = level.upper()
         if level_upper in ("ERROR", "CRITICAL"):
-            return curses.color_pair(ColorPair.ERROR)
+            return COLOR_ATTR[ColorPair.ERROR]
         elif level_upper == "WARNING":
-            return curses.color_pair(ColorPair.WARNING)
+            return COLOR_ATTR[ColorPair.WARNING]
         elif level_upper == "DEBUG":
-            return curses.color_pair(ColorPair.DEBUG)
+            return COLOR_ATTR[ColorPair.DEBUG]
         return curses.A_NORMAL
 
 
@@ -0,0 +1,157 @@
+"""Gap buffer line storage for the editable text panels."""
+
+from itertools import count
+
+# Globally unique, monotonically increasing edit stamps. Each mutation
+# takes a fresh stamp, so (version, width) uniquely identifies a line's
+# wrapped layout and is safe to use as a cache key.
+_VERSIONS = count()
+
+
+class GapBuffer:
+    """Editable line of text with O(1) amortized edits at the cursor.
+
+    The line is stored as a list of single-character strings with a gap
+    (an unused region) kept at the most recent edit position. Inserting
+    or deleting at the gap only moves the gap boundaries instead of
+    copying the whole line the way str slice-and-concat does; relocating
+    the gap is a memmove-backed slice assignment. A character list is
+    used rather than a bytearray so cursor indices stay correct for
+    non-ASCII text coming back from the model.
+    """
+
+    __slots__ = ("_buf", "_gap_start", "_gap_end", "version", "is_ascii")
+
+    # Minimum slack to reserve when the gap runs out
+    _MIN_GAP = 16
+
+    def __init__(self, text: str = "") -> None:
+        """Initialize the buffer.
+
+        Args:
+            text: Initial line content.
+        """
+        self._buf: list[str] = list(text)
+        self._gap_start: int = len(self._buf)
+        self._gap_end: int = len(self._buf)
+        self.version: int = next(_VERSIONS)
+        # Conservative flag: True only while every char is ASCII (one
+        # terminal cell each), letting wrap code take the fast path.
+        # Deleting the last non-ASCII char leaves it False, which is
+        # merely slower, never wrong.
+        self.is_ascii: bool = text.isascii()
+
+    def __len__(self) -> int:
+        """Number of characters in the line (excluding the gap)."""
+        return len(self._buf) - (self._gap_end - self._gap_start)
+
+    def __str__(self) -> str:
+        """Render the line as a plain string."""
+        return (
+            "".join(self._buf[:self._gap_start])
+            + "".join(self._buf[self._gap_end:])
+        )
+
+    def __bool__(self) -> bool:
+        """True if the line is non-empty."""
+        return len(self) > 0
+
+    def _move_gap(self, pos: int) -> None:
+        """Relocate the gap so it starts at logical position pos."""
+        gap_start = self._gap_start
+        gap_end = self._gap_end
+        buf = self._buf
+
+        if pos < gap_start:
+            n = gap_start - pos
+            buf[gap_end - n:gap_end] = buf[pos:gap_start]
+            self._gap_start = pos
+            self._gap_end = gap_end - n
+        elif pos > gap_start:
+            n = pos - gap_start
+            buf[gap_start:gap_start + n] = buf[gap_end:gap_end + n]
+            self._gap_start = pos
+            self._gap_end = gap_end + n
+
+    def insert(self, pos: int, text: str) -> None:
+        """Insert text at logical position pos.
+
+        Args:
+            pos: Character index to insert at.
+            text: Text to insert.
+        """
+        if not text:
+            return
+        if self.is_ascii and not text.isascii():
+            self.is_ascii = False
+        self._move_gap(pos)
+        gap_size = self._gap_end - self._gap_start
+        if len(text) > gap_size:
+            pad = max(len(text) - gap_size, self._MIN_GAP)
+            self._buf[self._gap_start:self._gap_start] = [""] * pad
+            self._gap_end += pad
+        self._buf[self._gap_start:self._gap_start + len(text)] = text
+        self._gap_start += len(text)
+        self.version = next(_VERSIONS)
+
+    def delete(self, pos: int, count: int = 1) -> None:
+        """Delete count characters starting at logical position pos.
+
+        Args:
+            pos: Character index to delete from.
+            count: Number of characters to remove.
+        """
+        if count <= 0 or pos >= len(self):
+            return
+        self._move_gap(pos)
+        self._gap_end = min(len(self._buf), self._gap_end + count)
+        self.version = next(_VERSIONS)
+
+    def split(self, pos: int) -> "GapBuffer":
+        """Split the line at pos, keeping the head and returning the tail.
+
+        Args:
+            pos: Character index to split at.
+
+        Returns:
+            New GapBuffer holding everything from pos onward.
+        """
+        tail = GapBuffer(self.substr(pos, len(self)))
+        self._move_gap(pos)
+        self._gap_end = len(self._buf)
+        self.version = next(_VERSIONS)
+        return tail
+
+    def extend(self, other: "GapBuffer") -> None:
+        """Append another line's content to this one.
+
+        Args:
+            other: Buffer whose content is appended.
+        """
+        self.insert(len(self), str(other))
+
+    def substr(self, start: int, stop: int) -> str:
+        """Get a substring by logical character indices.
+
+        Args:
+            start: Inclusive start index.
+            stop: Exclusive stop index.
+
+        Returns:
+            The requested slice of the line.
+        """
+        length = len(self)
+        start = max(0, min(start, length))
+        stop = max(start, min(stop, length))
+        gap_start = self._gap_start
+        offset = self._gap_end - gap_start
+        buf = self._buf
+
+        if stop <= gap_start:
+            return "".join(buf[start:stop])
+        if start >= gap_start:
+            return "".join(buf[start + offset:stop + offset])
+        return (
+            "".join(buf[start:gap_start])
+            + "".join(buf[self._gap_end:stop + offset])
+        )
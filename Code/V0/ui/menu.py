@@ -48,11 +48,47 @@ class Menu:
         self.y = y
         self.selected_index: int = 0
         self.visible: bool = False
+        # Attribute ints resolved lazily on first show(), after
+        # setup_colors() has initialized the pairs
+        self._attr_bg: Optional[int] = None
+        self._attr_bg_bold: Optional[int] = None
+        self._attr_sel: Optional[int] = None
+        self._rebuild_layout()
+
+    def _rebuild_layout(self) -> None:
+        """Precompute menu geometry and border strings.
+
+        Title and items are fixed at construction, so the dimensions,
+        border rows, and title row never change between draws.
+        """
+        self._hotkey_map = {
+            item.hotkey.lower(): item.action
+            for item in self.items
+            if item.hotkey
+        }
+        max_label_len = max(
+            (len(item.label) for item in self.items), default=0
+        )
+        width = max(len(self.title), max_label_len) + 6
+        self._menu_width = width
+        self._menu_height = len(self.items) + 4  # borders + title + items
+        self._top_border = "┌" + "─" * (width - 2) + "┐"
+        self._sep_border = "├" + "─" * (width - 2) + "┤"
+        self._bottom_border = "└" + "─" * (width - 2) + "┘"
+        self._title_padded = f" {self.title} ".center(width - 2)
 
     def show(self) -> None:
         """Show the menu."""
         self.visible = True
         self.selected_index = 0
+        self._ensure_attrs()
+
+    def _ensure_attrs(self) -> None:
+        """Resolve and cache the menu's attribute ints once."""
+        if self._attr_bg is None:
+            self._attr_bg = curses.color_pair(ColorPair.MENU_BG)
+            self._attr_bg_bold = self._attr_bg | curses.A_BOLD
+            self._attr_sel = curses.color_pair(ColorPair.MENU_SELECT)
 
     def hide(self) -> None:
         """Hide the menu."""
@@ -108,10 +144,10 @@ class Menu:
             self.hide()
             return None
 
-        # Check for hotkeys
-        for item in self.items:
-            if item.hotkey and chr(key).lower() == item.hotkey.lower():
-                return item.action
+        # Check for hotkeys (guard against key codes outside chr() range,
+        # e.g. function keys)
+        if self._hotkey_map and 0 <= key < 0x110000:
+            return self._hotkey_map.get(chr(key).lower())
 
         return None
 
@@ -120,10 +156,8 @@ class Menu:
         if not self.visible or not self.items:
             return
 
-        # Calculate menu dimensions
-        max_label_len = max(len(item.label) for item in self.items)
-        menu_width = max(len(self.title), max_label_len) + 6
-        menu_height = len(self.items) + 4  # title + border + items + border
+        menu_width = self._menu_width
+        menu_height = self._menu_height
 
         screen_height, screen_width = self.stdscr.getmaxyx()
 
@@ -133,51 +167,48 @@ class Menu:
         x = max(0, x)
         y = max(0, y)
 
-        border_attr = curses.color_pair(ColorPair.MENU_BG)
-        title_attr = curses.color_pair(ColorPair.MENU_BG) | curses.A_BOLD
+        # Attrs cached at show(); no color_pair calls in the draw loop
+        self._ensure_attrs()
+        border_attr = self._attr_bg
+        title_attr = self._attr_bg_bold
+        select_attr = self._attr_sel
+        # addnstr clips against the screen edge in C
+        max_n = screen_width - x
 
         try:
             # Top border
-            self.stdscr.addstr(
-                y, x,
-                "┌" + "─" * (menu_width - 2) + "┐",
-                border_attr,
+            self.stdscr.addnstr(y, x, self._top_border, max_n, border_attr)
+            # Title (full row, then re-attr the title slice for bold)
+            title_padded = self._title_padded
+            self.stdscr.addnstr(
+                y + 1, x, "│" + title_padded + "│", max_n, border_attr
+            )
+            self.stdscr.addnstr(
+                y + 1, x + 1, title_padded, max_n - 1, title_attr
             )
-            # Title
-            title_padded = f" {self.title} ".center(menu_width - 2)
-            self.stdscr.addstr(y + 1, x, "│", border_attr)
-            self.stdscr.addstr(y + 1, x + 1, title_padded, title_attr)
-            self.stdscr.addstr(y + 1, x + menu_width - 1, "│", border_attr)
 
             # Separator
-            self.stdscr.addstr(
-                y + 2, x,
-                "├" + "─" * (menu_width - 2) + "┤",
-                border_attr,
-            )
+            self.stdscr.addnstr(y + 2, x, self._sep_border, max_n, border_attr)
 
-            # Items
+            # Items - one preformatted row string per item; the selected
+            # row needs a second write to apply the highlight attr to
+            # the label slice only
             for i, item in enumerate(self.items):
                 row = y + 3 + i
-                if i == self.selected_index:
-                    attr = curses.color_pair(ColorPair.MENU_SELECT)
-                    prefix = "▸ "
-                else:
-                    attr = curses.color_pair(ColorPair.MENU_BG)
-                    prefix = "  "
-
-                label = prefix + item.label
-                label_padded = label.ljust(menu_width - 2)
-
-                self.stdscr.addstr(row, x, "│", border_attr)
-                self.stdscr.addstr(row, x + 1, label_padded, attr)
-                self.stdscr.addstr(row, x + menu_width - 1, "│", border_attr)
+                selected = (i == self.selected_index)
+                prefix = "▸ " if selected else "  "
+                label_padded = (prefix + item.label).ljust(menu_width - 2)
+                self.stdscr.addnstr(
+                    row, x, "│" + label_padded + "│", max_n, border_attr
+                )
+                if selected:
+                    self.stdscr.addnstr(
+                        row, x + 1, label_padded, max_n - 1, select_attr
+                    )
 
             # Bottom border
-            self.stdscr.addstr(
-                y + menu_height - 1, x,
-                "└" + "─" * (menu_width - 2) + "┘",
-                border_attr,
+            self.stdscr.addnstr(
+                y + menu_height - 1, x, self._bottom_border, max_n, border_attr
             )
         except curses.error:
             pass
@@ -1,6 +1,7 @@
 """Passage panel for displaying the list of passages."""
 
 import curses
+from itertools import accumulate
 from typing import Optional
 
 from models.passage import Passage
@@ -31,27 +32,97 @@ class PassagePanel:
         self.selected_index: int = 0
         self.scroll_offset: int = 0
         self.focused: bool = False
+        # Memoized id -> indicator color (the mapping is deterministic)
+        self._indicator_cache: dict[str, int] = {}
+        # Selection attr, resolved once after colors are initialized
+        self._sel_attr: Optional[int] = None
+        # Title string, rebuilt only when selection or count changes
+        self._title: str = ""
+        self._title_key: Optional[tuple[int, int]] = None
+        # Selection bottom-line strings ("─" runs) keyed by length, so
+        # the O(width) multiplication happens once per width
+        self._bottom_lines: dict[int, str] = {}
+        self._blank_lines: dict[int, str] = {}
+        # Dirty-region state: per-passage (start_y, end_y) ranges from
+        # the last full draw, and what that draw rendered. When only
+        # the selection moved, draw() repaints the two affected
+        # passages' decorations instead of erasing the whole window.
+        self._layout: dict[int, tuple[int, int]] = {}
+        self._layout_dims: tuple[int, int] = (0, 0)
+        self._last_selected: int = -1
+        self._last_focused: bool = False
+        self._needs_full_redraw: bool = True
+        self._content_fingerprint: tuple = tuple(
+            (p.id, len(p.text), p.pending, p.manual_edited)
+            for p in passages
+        )
+        # Full signature of the last-drawn state; identical signatures
+        # mean curses already holds the right buffer
+        self._last_sig: tuple = ()
+
+    # Decoration glyphs, bound once at class scope so draw loops reuse
+    # the same interned string objects every frame
+    _INDICATOR_CH = "▌"
+    _VLINE_CH = "│"
+    _HLINE_CH = "─"
+
+    # Gradient set for the per-passage indicator strips
+    _INDICATOR_COLORS = (
+        ColorPair.INDICATOR_1,
+        ColorPair.INDICATOR_2,
+        ColorPair.INDICATOR_3,
+        ColorPair.INDICATOR_4,
+        ColorPair.INDICATOR_5,
+        ColorPair.INDICATOR_6,
+    )
 
     def _get_indicator_color(self, passage_id: str) -> int:
         """Get a consistent color for a passage based on its ID.
 
+        The id-to-color mapping never changes, so it is computed once
+        per passage and served from a dict afterwards.
+
         Args:
             passage_id: Unique passage identifier.
 
         Returns:
             Color pair index from the gradient set.
         """
-        # Use hash of ID to deterministically pick a color
-        indicator_colors = [
-            ColorPair.INDICATOR_1,
-            ColorPair.INDICATOR_2,
-            ColorPair.INDICATOR_3,
-            ColorPair.INDICATOR_4,
-            ColorPair.INDICATOR_5,
-            ColorPair.INDICATOR_6,
-        ]
-        hash_val = sum(ord(c) for c in passage_id)
-        return indicator_colors[hash_val % len(indicator_colors)]
+        color = self._indicator_cache.get(passage_id)
+        if color is None:
+            # Use hash of ID to deterministically pick a color
+            hash_val = sum(map(ord, passage_id))
+            color = self._INDICATOR_COLORS[
+                hash_val % len(self._INDICATOR_COLORS)
+            ]
+            self._indicator_cache[passage_id] = color
+        return color
+
+    @staticmethod
+    def _wrapped(passage: Passage, width: int) -> list[str]:
+        """Get the wrapped lines for a passage, via its layout cache.
+
+        The cache lives on the passage itself, keyed by width, so the
+        wrap work happens once per edit rather than once per redraw
+        and is discarded together with the passage. Passage.update_text
+        clears the cache; the source-text identity check below catches
+        direct text assignments too.
+
+        Args:
+            passage: Passage to wrap.
+            width: Width available for text.
+
+        Returns:
+            List of wrapped lines for the passage text.
+        """
+        cache = passage._wrap_cache
+        if passage._wrap_src is not passage.text:
+            cache.clear()
+            passage._wrap_src = passage.text
+        lines = cache.get(width)
+        if lines is None:
+            lines = cache[width] = wrap_text(passage.text, width)
+        return lines
 
     def update_passages(self, passages: list[Passage]) -> None:
         """Update the passage list.
@@ -60,6 +131,16 @@ class PassagePanel:
             passages: New list of passages.
         """
         self.passages = passages
+        # Content changes invalidate the cached layout; the revision
+        # counter catches same-length text changes that could still
+        # wrap to a different number of rows
+        fingerprint = tuple(
+            (p.id, p.revision, p.pending, p.manual_edited)
+            for p in passages
+        )
+        if fingerprint != self._content_fingerprint:
+            self._content_fingerprint = fingerprint
+            self._needs_full_redraw = True
         # Clamp selection to valid range
         if self.passages:
             self.selected_index = min(
@@ -103,23 +184,194 @@ class PassagePanel:
             return self.passages[self.selected_index]
         return None
 
+    def _draw_title(self, border_color: int) -> None:
+        """Redraw the border and title row.
+
+        Args:
+            border_color: Color pair for the border.
+        """
+        draw_box(self.window, border_color)
+        key = (self.selected_index, len(self.passages))
+        if key != self._title_key:
+            self._title_key = key
+            if self.passages:
+                self._title = f" Passages ({key[0] + 1}/{key[1]}) "
+            else:
+                self._title = " Passages (empty) "
+        safe_addstr(self.window, 0, 2, self._title)
+
+    def _vstrip(
+        self, y0: int, y1: int, x: int, ch: str, attr: int = 0
+    ) -> None:
+        """Draw a vertical run of the same character.
+
+        Uses a single vline call where possible; vline takes chtype so
+        it rejects wide unicode characters, in which case this falls
+        back to per-row addstr.
+
+        Args:
+            y0: First row (inclusive).
+            y1: Row just past the strip.
+            x: Column to draw in.
+            ch: Single character to repeat.
+            attr: Attribute to draw with.
+        """
+        if y1 <= y0:
+            return
+        try:
+            self.window.vline(y0, x, ch, y1 - y0, attr)
+            return
+        except (TypeError, OverflowError, curses.error):
+            pass
+        for row in range(y0, y1):
+            try:
+                self.window.addstr(row, x, ch, attr)
+            except curses.error:
+                pass
+
+    def _draw_selection_decoration(
+        self, start_y: int, end_y: int, height: int, width: int, last: bool
+    ) -> None:
+        """Paint the selection outline for one passage range.
+
+        Args:
+            start_y: First row of the passage (inclusive).
+            end_y: Row just past the passage.
+            height: Window height.
+            width: Window width.
+            last: Whether the passage is the last in the list.
+        """
+        outline_right = width - 2
+        sel_attr = self._sel_attr
+        if sel_attr is None:
+            sel_attr = self._sel_attr = curses.color_pair(ColorPair.SELECTED)
+        visible_start = max(start_y, 1)
+        visible_end = min(end_y, height - 1)
+        # Right edge line only
+        self._vstrip(
+            visible_start, visible_end, outline_right,
+            self._VLINE_CH, sel_attr,
+        )
+        try:
+            # Bottom line (if visible and it's the actual end). Column
+            # 1 belongs to the next passage's indicator strip, so the
+            # line starts at column 2 unless this is the last passage.
+            if visible_end == end_y and visible_end < height - 1:
+                left = 1 if last else 2
+                n = outline_right - left
+                line = self._bottom_lines.setdefault(
+                    n, self._HLINE_CH * n
+                )
+                self.window.addstr(visible_end, left, line, sel_attr)
+        except curses.error:
+            pass
+
+    def _clear_selection_decoration(
+        self, start_y: int, end_y: int, height: int, width: int, last: bool
+    ) -> None:
+        """Blank out a previously drawn selection outline.
+
+        Args:
+            start_y: First row of the passage (inclusive).
+            end_y: Row just past the passage.
+            height: Window height.
+            width: Window width.
+            last: Whether the passage was the last in the list.
+        """
+        outline_right = width - 2
+        visible_start = max(start_y, 1)
+        visible_end = min(end_y, height - 1)
+        self._vstrip(visible_start, visible_end, outline_right, " ")
+        try:
+            if visible_end == end_y and visible_end < height - 1:
+                left = 1 if last else 2
+                n = outline_right - left
+                blank = self._blank_lines.setdefault(n, " " * n)
+                self.window.addstr(visible_end, left, blank)
+        except curses.error:
+            pass
+
     def draw(self) -> None:
-        """Render the passage panel with subtle colored indicators."""
-        self.window.erase()
+        """Render the passage panel.
+
+        When nothing at all changed since the last draw, the window
+        buffer is still valid and only noutrefresh is issued. When only
+        the selection moved, just the old and new selections'
+        decorations (and the title) are repainted; content changes,
+        focus changes, and resizes fall back to a full redraw.
+        """
         height, width = self.window.getmaxyx()
 
-        # Draw border
+        sig = (
+            self.focused,
+            self.selected_index,
+            self.scroll_offset,
+            (height, width),
+            tuple(
+                (p.id, p.revision, p.pending, p.manual_edited)
+                for p in self.passages
+            ),
+        )
+        if sig == self._last_sig:
+            self.window.noutrefresh()
+            return
+        self._last_sig = sig
+
+        old_sel = self._last_selected
+        if (
+            not self._needs_full_redraw
+            and self.passages
+            and self._layout_dims == (height, width)
+            and self.focused == self._last_focused
+            and old_sel in self._layout
+            and self.selected_index in self._layout
+        ):
+            if self.selected_index != old_sel:
+                if self.focused:
+                    start, end = self._layout[old_sel]
+                    self._clear_selection_decoration(
+                        start, end, height, width,
+                        old_sel == len(self.passages) - 1,
+                    )
+                    start, end = self._layout[self.selected_index]
+                    self._draw_selection_decoration(
+                        start, end, height, width,
+                        self.selected_index == len(self.passages) - 1,
+                    )
+                # Title shows the selected index, so it changes too
+                border_color = (
+                    ColorPair.BORDER_FOCUS if self.focused
+                    else ColorPair.BORDER_DIM
+                )
+                self._draw_title(border_color)
+                self._last_selected = self.selected_index
+            self.window.noutrefresh()
+            return
+
+        self._draw_full(height, width)
+
+    def _draw_full(self, height: int, width: int) -> None:
+        """Render every passage from scratch.
+
+        Args:
+            height: Window height.
+            width: Window width.
+        """
+        self.window.erase()
+
+        # Draw border and title
         border_color = (
             ColorPair.BORDER_FOCUS if self.focused else ColorPair.BORDER_DIM
         )
-        draw_box(self.window, border_color)
+        self._draw_title(border_color)
 
-        # Draw title
-        if self.passages:
-            title = f" Passages ({self.selected_index + 1}/{len(self.passages)}) "
-        else:
-            title = " Passages (empty) "
-        safe_addstr(self.window, 0, 2, title)
+        # Record what this draw renders so selection-only changes can
+        # take the partial path next time
+        self._layout = {}
+        self._layout_dims = (height, width)
+        self._last_selected = self.selected_index
+        self._last_focused = self.focused
+        self._needs_full_redraw = False
 
         if not self.passages:
             safe_addstr(
@@ -130,88 +382,93 @@ class PassagePanel:
             return
 
         # Content area: just border + small left margin + text
-        content_height = height - 2
         content_width = width - 4  # Standard margins
+        wrap_width = content_width - 1
+
+        # Wrapped lines per passage, computed once and reused for both
+        # the layout pass and the render loop below
+        wrapped: list = []
+        for passage in self.passages:
+            text = passage.text
+            if len(text) <= wrap_width and "\n" not in text:
+                # Fits on one line: skip the wrap machinery and its
+                # cache entirely (a tuple avoids the list allocation)
+                wrapped.append((text,))
+            else:
+                wrapped.append(self._wrapped(passage, wrap_width))
+
+        # Block heights (spacing row for all but the first passage,
+        # optional status row, text rows) folded into one running
+        # prefix sum, so every start_y/end_y is an O(1) lookup instead
+        # of serial y bookkeeping
+        starts = list(accumulate(
+            (
+                (1 if i > 0 else 0)
+                + (1 if (p.pending or p.manual_edited) else 0)
+                + len(lines)
+                for i, (p, lines) in enumerate(zip(self.passages, wrapped))
+            ),
+            initial=1,
+        ))
 
-        y = 1
         # Always start from first passage (scroll_offset is always 0)
         # Render all passages completely, even if they extend beyond screen
-        for i in range(len(self.passages)):
-            passage = self.passages[i]
-            is_selected = (i == self.selected_index)
-            start_y = y
-
-            # Get color for this passage's indicator
-            indicator_color = self._get_indicator_color(passage.id)
-
-            # Add spacing between passages (one blank line)
-            if i > 0:
-                y += 1
+        for i, (passage, text_lines) in enumerate(
+            zip(self.passages, wrapped)
+        ):
+            start_y = starts[i]
+            end_y = starts[i + 1]
+            # Skip the spacing row between passages
+            y = start_y + 1 if i > 0 else start_y
 
             # Status indicator (pending/edited) as first line if needed
             if passage.pending or passage.manual_edited:
-                status = ""
-                if passage.pending:
-                    status = "⏳ generating..."
-                elif passage.manual_edited:
-                    status = "✎ edited"
-                safe_addstr(self.window, y, 3, status, curses.A_DIM)
-                y += 1
-
-            # Complete passage text - render ALL lines regardless of screen size
-            text_lines = wrap_text(passage.text, content_width - 1)
-            for line in text_lines:
-                # Only draw if within visible area
+                status = (
+                    "⏳ generating..." if passage.pending else "✎ edited"
+                )
                 if 1 <= y < height - 1:
-                    if passage.pending:
-                        # Pending passages show in dim color
-                        attr = curses.A_DIM
-                    else:
-                        attr = 0
-                    safe_addstr(self.window, y, 3, line, attr)
-                y += 1
-
-            # Draw subtle colored indicator on far left edge (column 1)
-            # Only draw within visible area
-            end_y = y
-            for row in range(start_y, end_y):
-                if 1 <= row < height - 1:
                     try:
-                        self.window.addstr(
-                            row, 1, "▌",
-                            curses.color_pair(indicator_color)
+                        self.window.addnstr(
+                            y, 3, status, content_width, curses.A_DIM
                         )
                     except curses.error:
                         pass
+                y += 1
 
-            # Draw subtle highlight on selected passage (only when panel is focused)
-            if is_selected and self.focused:
-                # Calculate outline dimensions - full width
-                outline_left = 1
-                outline_right = width - 2
-                outline_width = outline_right - outline_left
-
-                # Only draw outline within visible area
-                visible_start = max(start_y, 1)
-                visible_end = min(end_y, height - 1)
-
+            # Pre-slice the block to the rows inside the border, then
+            # write each with addnstr: one C call per line, truncation
+            # done C-side, no per-line bounds branch or getmaxyx.
+            # Passages share one attr (dim while pending), so nothing
+            # varies inside the loop.
+            attr = curses.A_DIM if passage.pending else 0
+            first_vis = max(1 - y, 0)
+            last_vis = max(first_vis, min(height - 1 - y, len(text_lines)))
+            row = y + first_vis
+            for line in text_lines[first_vis:last_vis]:
                 try:
-                    # Right edge line only
-                    for row in range(visible_start, visible_end):
-                        if 1 <= row < height - 1:
-                            self.window.addstr(
-                                row, outline_right, "│",
-                                curses.color_pair(ColorPair.SELECTED)
-                            )
-
-                    # Bottom line (if visible and it's the actual end)
-                    if visible_end == end_y and visible_end < height - 1:
-                        bottom_line = "─" * outline_width
-                        self.window.addstr(
-                            visible_end, outline_left, bottom_line,
-                            curses.color_pair(ColorPair.SELECTED)
-                        )
+                    self.window.addnstr(row, 3, line, content_width, attr)
                 except curses.error:
                     pass
+                row += 1
+            y += len(text_lines)
+
+            # Draw subtle colored indicator on far left edge (column 1)
+            # Only draw within visible area
+            ind_attr = curses.color_pair(
+                self._get_indicator_color(passage.id)
+            )
+            self._vstrip(
+                max(start_y, 1), min(end_y, height - 1), 1,
+                self._INDICATOR_CH, ind_attr,
+            )
+
+            self._layout[i] = (start_y, end_y)
+
+            # Draw subtle highlight on selected passage (only when panel is focused)
+            if i == self.selected_index and self.focused:
+                self._draw_selection_decoration(
+                    start_y, end_y, height, width,
+                    i == len(self.passages) - 1,
+                )
 
         self.window.noutrefresh()
@@ -0,0 +1,560 @@
+"""Shared editing and rendering machinery for the text panels."""
+
+import curses
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Optional
+from unicodedata import east_asian_width
+
+from ui import _wrap_jit
+from ui.base import PRINTABLE_CHARS, ColorPair, draw_box, safe_addstr
+from ui.gap_buffer import GapBuffer
+
+# wcwidth gives exact terminal cell widths (combining marks, wide CJK,
+# zero-width joiners). Fall back to the east-asian-width heuristic when
+# it is not installed.
+try:
+    from wcwidth import wcwidth as _wcwidth
+except ImportError:
+    _wcwidth = None
+
+
+def _cell_width(char: str) -> int:
+    """Get the terminal cell width of a single character.
+
+    Args:
+        char: Character to measure.
+
+    Returns:
+        Number of terminal cells the character occupies (0, 1, or 2).
+    """
+    if _wcwidth is not None:
+        width = _wcwidth(char)
+        return width if width > 0 else 0
+    return 2 if east_asian_width(char) in ("W", "F") else 1
+
+
+# Compile the optional wrap kernel at import time (module import runs
+# during startup, before the interactive loop)
+_wrap_jit.warm_up()
+
+
+class _TextPanel:
+    """Common base for the editable text panels.
+
+    EditPanel and InputPanel differ only in title, focus border color,
+    and a few extra operations; everything hot - key dispatch, the
+    gap-buffer lines, the wrap cache, the incremental row prefix sum,
+    and the draw path - lives here once, so both panels share one
+    implementation (and the interpreter's per-class method caches warm
+    up once instead of twice).
+    """
+
+    # Subclasses override these
+    _TITLE = ""
+    _FOCUS_COLOR = ColorPair.BORDER_FOCUS
+
+    # Bound on cached wrapped layouts (roughly a few screens of lines)
+    _WRAP_CACHE_MAX = 512
+
+    # Key-code -> handler name; one dict lookup per keystroke.
+    # Enter is intentionally absent: EditPanel adds it, while for
+    # InputPanel the editor intercepts Enter to send the input.
+    _KEY_DISPATCH = {
+        curses.KEY_BACKSPACE: "_handle_backspace",
+        127: "_handle_backspace",
+        8: "_handle_backspace",
+        curses.KEY_DC: "_handle_delete",
+        curses.KEY_LEFT: "_handle_left",
+        curses.KEY_RIGHT: "_handle_right",
+        curses.KEY_UP: "_handle_up",
+        curses.KEY_DOWN: "_handle_down",
+        curses.KEY_HOME: "_handle_home",
+        curses.KEY_END: "_handle_end",
+    }
+
+    def __init__(self, window: "curses.window", initial_text: str = "") -> None:
+        """Initialize the panel.
+
+        Args:
+            window: Curses window to render into.
+            initial_text: Initial text content.
+        """
+        self.window = window
+        self.lines: list[GapBuffer] = (
+            [GapBuffer(line) for line in initial_text.split("\n")]
+            if initial_text else [GapBuffer()]
+        )
+        self.cursor_x: int = 0
+        self.cursor_y: int = 0
+        self.scroll_offset: int = 0
+        self._focused: bool = True
+        # Redraw only when something changed since the last draw
+        self._dirty: bool = True
+        # Content-area dimensions, cached by _refresh_dims()
+        self._content_height: int = 0
+        self._content_width: int = 0
+        self._refresh_dims()
+        # Wrapped-chunk LRU keyed by (line version, width); unchanged
+        # lines reuse their chunks across draws
+        self._wrap_cache: OrderedDict[tuple[int, int], list[str]] = (
+            OrderedDict()
+        )
+        # Row prefix sum, maintained incrementally from the first line
+        # whose row count changed (None = up to date)
+        self._prefix: list[int] = [0]
+        self._prefix_width: int = -1
+        self._rows_dirty_from: Optional[int] = 0
+        # Live character total (newlines excluded) for O(1) emptiness
+        # checks
+        self._char_count: int = sum(len(line) for line in self.lines)
+
+    def get_text(self) -> str:
+        """Get all text as a single string.
+
+        Returns:
+            Combined text from all lines.
+        """
+        return "\n".join(str(line) for line in self.lines)
+
+    def set_text(self, text: str) -> None:
+        """Set the text content.
+
+        Args:
+            text: New text content.
+        """
+        self.lines = (
+            [GapBuffer(line) for line in text.split("\n")]
+            if text else [GapBuffer()]
+        )
+        self.cursor_x = 0
+        self.cursor_y = 0
+        self.scroll_offset = 0
+        self._dirty = True
+        self._prefix = [0]
+        self._rows_dirty_from = 0
+        self._char_count = sum(len(line) for line in self.lines)
+
+    @property
+    def focused(self) -> bool:
+        """Whether this panel currently has focus."""
+        return self._focused
+
+    @focused.setter
+    def focused(self, value: bool) -> None:
+        if value != self._focused:
+            self._focused = value
+            self._dirty = True
+
+    def handle_key(self, key: int) -> bool:
+        """Handle a keypress in the panel.
+
+        Args:
+            key: The key code pressed.
+
+        Returns:
+            True if the key was handled.
+        """
+        handler = self._KEY_DISPATCH.get(key)
+        if handler is not None:
+            self._dirty = True
+            # A join with the previous line can shrink cursor_y - 1
+            self._mark_rows_dirty(self.cursor_y - 1)
+            return getattr(self, handler)()
+        if 0 <= key < 128:
+            char = PRINTABLE_CHARS[key]
+            if char is not None:
+                self._dirty = True
+                self._mark_rows_dirty(self.cursor_y)
+                return self._handle_char(char)
+        # Non-ASCII input is dropped: the editor reads keys with
+        # getch(), which delivers UTF-8 multibyte characters one byte
+        # at a time, so treating those bytes as code points would
+        # insert mojibake. Cell-width wrapping still handles non-ASCII
+        # text arriving from model output or loaded documents.
+        return False
+
+    def _handle_enter(self) -> bool:
+        """Handle Enter key - insert newline."""
+        line = self.lines[self.cursor_y]
+        # Split line at cursor
+        tail = line.split(self.cursor_x)
+        self.lines.insert(self.cursor_y + 1, tail)
+        self.cursor_y += 1
+        self.cursor_x = 0
+        self._ensure_visible()
+        return True
+
+    def _handle_backspace(self) -> bool:
+        """Handle backspace key."""
+        if self.cursor_x > 0:
+            self.lines[self.cursor_y].delete(self.cursor_x - 1)
+            self.cursor_x -= 1
+            self._char_count -= 1
+        elif self.cursor_y > 0:
+            # Join with previous line
+            prev_len = len(self.lines[self.cursor_y - 1])
+            self.lines[self.cursor_y - 1].extend(self.lines[self.cursor_y])
+            del self.lines[self.cursor_y]
+            self.cursor_y -= 1
+            self.cursor_x = prev_len
+            self._ensure_visible()
+        return True
+
+    def _handle_delete(self) -> bool:
+        """Handle delete key."""
+        line = self.lines[self.cursor_y]
+        if self.cursor_x < len(line):
+            line.delete(self.cursor_x)
+            self._char_count -= 1
+        elif self.cursor_y < len(self.lines) - 1:
+            # Join with next line
+            line.extend(self.lines[self.cursor_y + 1])
+            del self.lines[self.cursor_y + 1]
+        return True
+
+    def _handle_left(self) -> bool:
+        """Handle left arrow."""
+        if self.cursor_x > 0:
+            self.cursor_x -= 1
+        elif self.cursor_y > 0:
+            self.cursor_y -= 1
+            self.cursor_x = len(self.lines[self.cursor_y])
+            self._ensure_visible()
+        return True
+
+    def _handle_right(self) -> bool:
+        """Handle right arrow."""
+        if self.cursor_x < len(self.lines[self.cursor_y]):
+            self.cursor_x += 1
+        elif self.cursor_y < len(self.lines) - 1:
+            self.cursor_y += 1
+            self.cursor_x = 0
+            self._ensure_visible()
+        return True
+
+    def _handle_up(self) -> bool:
+        """Handle up arrow."""
+        if self.cursor_y > 0:
+            self.cursor_y -= 1
+            self.cursor_x = min(self.cursor_x, len(self.lines[self.cursor_y]))
+            self._ensure_visible()
+        return True
+
+    def _handle_down(self) -> bool:
+        """Handle down arrow."""
+        if self.cursor_y < len(self.lines) - 1:
+            self.cursor_y += 1
+            self.cursor_x = min(self.cursor_x, len(self.lines[self.cursor_y]))
+            self._ensure_visible()
+        return True
+
+    def _handle_home(self) -> bool:
+        """Handle Home key."""
+        self.cursor_x = 0
+        return True
+
+    def _handle_end(self) -> bool:
+        """Handle End key."""
+        self.cursor_x = len(self.lines[self.cursor_y])
+        return True
+
+    def _handle_char(self, char: str) -> bool:
+        """Handle printable character."""
+        self.lines[self.cursor_y].insert(self.cursor_x, char)
+        self.cursor_x += 1
+        self._char_count += 1
+        return True
+
+    def _refresh_dims(self) -> tuple[int, int]:
+        """Re-read window dimensions and cache the content area.
+
+        Called once per draw; key handlers use the cached values
+        instead of making their own getmaxyx calls.
+
+        Returns:
+            Tuple of (height, width) for the whole window.
+        """
+        height, width = self.window.getmaxyx()
+        self._content_height = height - 2
+        self._content_width = width - 4
+        return height, width
+
+    def _ensure_visible(self) -> None:
+        """Ensure cursor is visible by adjusting scroll."""
+        content_height = self._content_height
+
+        if self.cursor_y < self.scroll_offset:
+            self.scroll_offset = self.cursor_y
+        elif self.cursor_y >= self.scroll_offset + content_height:
+            self.scroll_offset = self.cursor_y - content_height + 1
+
+    def _line_chunks(self, line: GapBuffer, content_width: int) -> list[str]:
+        """Get the wrapped chunks for one line, via the LRU cache.
+
+        Args:
+            line: Source line buffer.
+            content_width: Width available for text.
+
+        Returns:
+            List of fixed-width chunk strings (one empty chunk for an
+            empty line).
+        """
+        if not line:
+            return [""]
+
+        key = (line.version, content_width)
+        cache = self._wrap_cache
+        chunks = cache.get(key)
+        if chunks is None:
+            if line.is_ascii:
+                # Fast path: one char == one cell, chunks are fixed
+                # width slices
+                chunks = [
+                    line.substr(pos, pos + content_width)
+                    for pos in range(0, len(line), content_width)
+                ]
+            else:
+                text = str(line)
+                if (
+                    _wrap_jit.HAVE_JIT
+                    and len(text) >= _wrap_jit.JIT_THRESHOLD
+                ):
+                    chunks = self._wrap_by_cells_jit(text, content_width)
+                else:
+                    chunks = self._wrap_by_cells(text, content_width)
+            cache[key] = chunks
+            if len(cache) > self._WRAP_CACHE_MAX:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return chunks
+
+    @staticmethod
+    def _wrap_by_cells(text: str, content_width: int) -> list[str]:
+        """Wrap a non-ASCII line by terminal cell width.
+
+        Args:
+            text: Line content.
+            content_width: Cells available per display row.
+
+        Each character is measured exactly once into a cumulative width
+        array; chunk boundaries are then found by bisecting that array
+        instead of re-accumulating cells in a per-character Python loop.
+
+        Returns:
+            List of chunk strings, each at most content_width cells
+            (except a lone character wider than the row).
+        """
+        cum = list(accumulate(map(_cell_width, text)))
+        n = len(text)
+        chunks: list[str] = []
+        start = 0
+        base = 0
+        while start < n:
+            # Largest end such that the chunk's total width fits;
+            # trailing zero-width characters bind to the chunk
+            end = bisect_right(cum, base + content_width, start)
+            if end == start:
+                # Single character wider than the row; emit it alone
+                end = start + 1
+            chunks.append(text[start:end])
+            base = cum[end - 1]
+            start = end
+        return chunks or [""]
+
+    @staticmethod
+    def _wrap_by_cells_jit(text: str, content_width: int) -> list[str]:
+        """Wrap a very long non-ASCII line via the compiled kernel.
+
+        Args:
+            text: Line content.
+            content_width: Cells available per display row.
+
+        Returns:
+            List of chunk strings, each at most content_width cells.
+        """
+        widths = _wrap_jit.np.fromiter(
+            (_cell_width(char) for char in text),
+            dtype=_wrap_jit.np.int32,
+            count=len(text),
+        )
+        starts = _wrap_jit.wrap_starts(widths, content_width)
+        starts.append(len(text))
+        return [
+            text[starts[i]:starts[i + 1]]
+            for i in range(len(starts) - 1)
+        ]
+
+    def _mark_rows_dirty(self, line_idx: int) -> None:
+        """Invalidate the row prefix sum from line_idx onward.
+
+        Args:
+            line_idx: First source line whose row count may have changed.
+        """
+        line_idx = max(0, line_idx)
+        if self._rows_dirty_from is None or line_idx < self._rows_dirty_from:
+            self._rows_dirty_from = line_idx
+
+    def _row_prefix(self, content_width: int) -> list[int]:
+        """Get the wrapped-row prefix sum for the buffer.
+
+        Edits touch one line at a time, so the sum is only recomputed
+        from the first invalidated line; untouched entries before it are
+        reused. A width change invalidates everything.
+
+        Args:
+            content_width: Width available for text.
+
+        Returns:
+            List where entry i is the display row at which source line i
+            begins; the final entry is the total row count.
+        """
+        if content_width != self._prefix_width:
+            self._prefix_width = content_width
+            self._rows_dirty_from = 0
+
+        prefix = self._prefix
+        start = self._rows_dirty_from
+        if start is None:
+            return prefix
+
+        if start >= len(prefix):
+            start = 0
+        del prefix[start + 1:]
+        total = prefix[start]
+        for i in range(start, len(self.lines)):
+            line = self.lines[i]
+            if line.is_ascii:
+                total += max(1, -(-len(line) // content_width))
+            else:
+                total += len(self._line_chunks(line, content_width))
+            prefix.append(total)
+        self._rows_dirty_from = None
+        return prefix
+
+    def _cursor_display_pos(
+        self, prefix: list[int], content_width: int
+    ) -> tuple[int, int]:
+        """Locate the cursor in wrapped display coordinates.
+
+        Args:
+            prefix: Row prefix sum from _row_prefix.
+            content_width: Width available for text.
+
+        Returns:
+            Tuple of (cursor_display_row, cursor_display_col).
+        """
+        line = self.lines[self.cursor_y]
+        if not line.is_ascii:
+            # Walk the cached chunks, converting the char index into a
+            # (row, cell) position
+            chunks = self._line_chunks(line, content_width)
+            remaining = min(self.cursor_x, len(line))
+            row_in_line = 0
+            col = 0
+            for row_in_line, chunk in enumerate(chunks):
+                if remaining < len(chunk) or row_in_line == len(chunks) - 1:
+                    col = sum(_cell_width(c) for c in chunk[:remaining])
+                    break
+                remaining -= len(chunk)
+        elif self.cursor_x < len(line):
+            row_in_line = self.cursor_x // content_width
+            col = self.cursor_x % content_width
+        elif len(line) == 0:
+            row_in_line = 0
+            col = 0
+        else:
+            # Cursor at end of line: end of the last chunk
+            row_in_line = (len(line) - 1) // content_width
+            col = len(line) - row_in_line * content_width
+        return prefix[self.cursor_y] + row_in_line, col
+
+    def draw(self) -> None:
+        """Render the panel with soft line wrapping.
+
+        Only the visible rows are wrapped; offscreen lines contribute a
+        row count (from their length) but are never sliced.
+        """
+        if not self._dirty:
+            # Nothing changed since the last draw; skip noutrefresh too
+            # so doupdate has nothing to flush for this window
+            return
+
+        height, width = self._refresh_dims()
+
+        # Clear only the content rows; the border and title are repainted
+        # below, so a full erase() is unnecessary
+        for row in range(1, height - 1):
+            try:
+                self.window.move(row, 1)
+                self.window.clrtoeol()
+            except curses.error:
+                pass
+
+        # Draw border
+        border_color = (
+            self._FOCUS_COLOR if self.focused else ColorPair.BORDER_DIM
+        )
+        draw_box(self.window, border_color)
+
+        # Draw title
+        safe_addstr(self.window, 0, 2, self._TITLE)
+
+        # Content area
+        content_height = self._content_height
+        content_width = self._content_width
+
+        if content_width <= 0:
+            self.window.noutrefresh()
+            return
+
+        prefix = self._row_prefix(content_width)
+        total_rows = prefix[-1]
+        cursor_row, cursor_col = self._cursor_display_pos(
+            prefix, content_width
+        )
+
+        # Adjust scroll to keep cursor visible
+        if cursor_row < self.scroll_offset:
+            self.scroll_offset = cursor_row
+        elif cursor_row >= self.scroll_offset + content_height:
+            self.scroll_offset = cursor_row - content_height + 1
+
+        # Clamp scroll offset
+        max_scroll = max(0, total_rows - content_height)
+        self.scroll_offset = min(self.scroll_offset, max_scroll)
+
+        # Draw only the visible rows: binary-search the first source
+        # line, then walk forward until the window is full
+        line_idx = bisect_right(prefix, self.scroll_offset) - 1
+        skip = self.scroll_offset - prefix[line_idx]
+        y = 1
+        while line_idx < len(self.lines) and y <= content_height:
+            chunks = self._line_chunks(self.lines[line_idx], content_width)
+            for chunk in chunks[skip:]:
+                if y > content_height:
+                    break
+                # addnstr truncates in C; no per-row bounds checks or
+                # slice allocations needed
+                try:
+                    self.window.addnstr(y, 2, chunk, content_width)
+                except curses.error:
+                    pass
+                y += 1
+            skip = 0
+            line_idx += 1
+
+        # Position cursor if focused
+        if self.focused:
+            cursor_screen_y = cursor_row - self.scroll_offset + 1
+            cursor_screen_x = cursor_col + 2
+            if 0 < cursor_screen_y < height - 1 and cursor_screen_x < width - 1:
+                try:
+                    self.window.move(cursor_screen_y, cursor_screen_x)
+                except curses.error:
+                    pass
+
+        self._dirty = False
+        self.window.noutrefresh()
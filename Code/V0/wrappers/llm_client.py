@@ -1,13 +1,30 @@
 """LLM API client wrapper for OpenAI-compatible endpoints."""
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional, Protocol, runtime_checkable
 import logging
 import json
 
 from logging_config import get_logger
 
+# OpenAI client class, resolved lazily on first construction so the
+# module imports without openai installed, then cached so repeated
+# constructions skip the import machinery entirely
+_OpenAI = None
+
+
+def _openai_class():
+    """Get the OpenAI client class, importing it on first use.
+
+    Returns:
+        The openai.OpenAI class.
+    """
+    global _OpenAI
+    if _OpenAI is None:
+        from openai import OpenAI as _OpenAI_imported
+        _OpenAI = _OpenAI_imported
+    return _OpenAI
+
 
 @dataclass
 class LLMResponse:
@@ -21,34 +38,85 @@ class LLMResponse:
     error: Optional[str] = None
 
 
-class LLMClientBase(ABC):
-    """Abstract base class for LLM API clients."""
+@runtime_checkable
+class LLMClientBase(Protocol):
+    """Structural interface for LLM API clients.
+
+    A Protocol rather than an ABC: any client with a matching
+    complete() satisfies the interface without inheriting, and
+    explicit subclasses stay free to declare __slots__. complete_batch
+    has a default sequential implementation that subclasses inherit.
+    """
+
+    __slots__ = ()
 
-    @abstractmethod
     def complete(
         self,
         prompt: str,
-        system_prompt: str,
+        system_prompt: "str | tuple[str, str]",
         max_tokens: Optional[int] = None,
         temperature: float = 0.7,
+        stream: bool = True,
+        on_chunk: Optional[Callable[[str], None]] = None,
     ) -> LLMResponse:
         """Send completion request to the LLM.
 
         Args:
             prompt: The user prompt/message.
-            system_prompt: System instructions for the model.
+            system_prompt: System instructions for the model. A
+                (cached, dynamic) tuple sends two system messages so
+                servers with prompt-prefix caching can reuse the KV
+                state of the stable part across requests.
             max_tokens: Maximum tokens in response (None for unlimited).
             temperature: Sampling temperature (0.0-1.0).
+            stream: Stream the response token-by-token instead of
+                blocking until it is complete.
+            on_chunk: Optional callback invoked with each text delta
+                as it arrives (streaming only).
 
         Returns:
             LLMResponse with the completion result.
         """
-        pass
+        raise NotImplementedError
+
+    def complete_batch(
+        self,
+        prompts: list[str],
+        system_prompt: "str | tuple[str, str]",
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> list[LLMResponse]:
+        """Complete several prompts sharing one system prompt.
+
+        Base implementation is a sequential loop; subclasses may
+        consolidate the prompts into fewer requests.
+
+        Args:
+            prompts: User prompts to complete, in order.
+            system_prompt: System instructions shared by all prompts.
+            max_tokens: Maximum tokens per response (None for unlimited).
+            temperature: Sampling temperature (0.0-1.0).
+
+        Returns:
+            One LLMResponse per prompt, in the same order.
+        """
+        return [
+            self.complete(prompt, system_prompt, max_tokens, temperature)
+            for prompt in prompts
+        ]
 
 
 class OpenAICompatibleClient(LLMClientBase):
     """Wrapper for OpenAI-compatible APIs (Cerebras, local models, etc.)."""
 
+    __slots__ = (
+        "client", "model", "logger", "debug", "_http_client",
+        "_msg_template", "_msg_system",
+    )
+
+    # Marker used by complete_batch to join and split batched responses
+    _BATCH_SEP = "<<<SEP>>>"
+
     def __init__(
         self,
         api_key: str,
@@ -67,32 +135,98 @@ class OpenAICompatibleClient(LLMClientBase):
             logger: Optional logger instance.
             debug: Enable detailed request/response logging.
         """
-        # Import here to allow module to load without openai installed
-        from openai import OpenAI
+        # Resolved here, not at module import, so the module loads
+        # without openai installed
+        OpenAI = _openai_class()
 
         # Use dummy key for servers that don't require auth (like LM Studio)
         # OpenAI client requires non-empty api_key even if server ignores it
         effective_key = api_key if api_key else "lm-studio"
 
-        self.client = OpenAI(base_url=base_url, api_key=effective_key)
+        # Pooled transport keeps the TCP+TLS connection warm across
+        # back-to-back generations, removing the handshake from every
+        # call after the first; with the h2 extra installed, HTTP/2
+        # also multiplexes streaming on a single socket
+        self._http_client = self._build_http_client()
+        if self._http_client is not None:
+            self.client = OpenAI(
+                base_url=base_url,
+                api_key=effective_key,
+                http_client=self._http_client,
+            )
+        else:
+            self.client = OpenAI(base_url=base_url, api_key=effective_key)
         self.model = model
         self.logger = logger or get_logger("llm_client")
         self.debug = debug
+        # Messages template reused across calls with the same system
+        # prompt; only the user content is swapped per call
+        self._msg_template: Optional[list[dict]] = None
+        self._msg_system: "Optional[str | tuple[str, str]]" = None
+
+    @staticmethod
+    def _build_http_client():
+        """Build a pooled httpx client for connection reuse.
+
+        Returns:
+            Configured httpx.Client, or None when httpx is unavailable
+            (the OpenAI SDK then uses its own default transport).
+        """
+        try:
+            import httpx
+        except ImportError:
+            return None
+        limits = httpx.Limits(
+            max_keepalive_connections=4, keepalive_expiry=60.0
+        )
+        timeout = httpx.Timeout(60.0, connect=5.0)
+        try:
+            return httpx.Client(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # h2 extra not installed; HTTP/1.1 keep-alive still pools
+            return httpx.Client(limits=limits, timeout=timeout)
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        if self._http_client is not None:
+            self._http_client.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def complete(
         self,
         prompt: str,
-        system_prompt: str,
+        system_prompt: "str | tuple[str, str]",
         max_tokens: Optional[int] = None,
         temperature: float = 0.7,
+        stream: bool = True,
+        on_chunk: Optional[Callable[[str], None]] = None,
     ) -> LLMResponse:
         """Send completion request to the API.
 
+        Streaming overlaps network I/O with the UI: text becomes
+        available as it is generated instead of after the whole
+        response lands. The return value is the same either way; pass
+        on_chunk to observe partial text (e.g. to grow a pending
+        passage progressively).
+
         Args:
             prompt: The user prompt/message.
-            system_prompt: System instructions for the model.
+            system_prompt: System instructions for the model. Pass a
+                (cached, dynamic) tuple to send the stable part as its
+                own leading system message: servers with prompt-prefix
+                caching (vLLM, TGI, SGLang, Cerebras) then skip
+                re-processing it, while per-request context lives in
+                the second message without breaking the cached prefix.
             max_tokens: Maximum tokens in response (None uses default 4096).
             temperature: Sampling temperature (0.0-1.0).
+            stream: Stream the response token-by-token (default).
+            on_chunk: Optional callback invoked with each text delta
+                as it arrives (streaming only).
 
         Returns:
             LLMResponse with the completion result.
@@ -102,49 +236,87 @@ class OpenAICompatibleClient(LLMClientBase):
                 f"API call: {len(prompt)} chars prompt, model={self.model}"
             )
 
-            # Build request payload
+            # Build (or reuse) the messages list; the cached part of a
+            # split system prompt goes first so it forms a stable token
+            # prefix. Back-to-back calls with the same system prompt
+            # reuse the template and swap only the user content - the
+            # SDK copies messages into its own models at call time, so
+            # mutating between (non-concurrent) calls is safe.
+            if (
+                self._msg_template is not None
+                and self._msg_system == system_prompt
+            ):
+                messages = self._msg_template
+                messages[-1]["content"] = prompt
+            else:
+                if isinstance(system_prompt, tuple):
+                    cached, dynamic = system_prompt
+                    messages = [
+                        {"role": "system", "content": cached},
+                        {"role": "system", "content": dynamic},
+                        {"role": "user", "content": prompt},
+                    ]
+                else:
+                    messages = [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ]
+                self._msg_template = messages
+                self._msg_system = system_prompt
             request_payload = {
                 "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
+                "messages": messages,
                 "max_tokens": max_tokens or 4096,
                 "temperature": temperature,
             }
 
-            # Log request payload in debug mode
-            if self.debug:
+            # Log request payload in debug mode. The level check avoids
+            # serializing the payload when DEBUG is filtered out by the
+            # logger anyway; compact dumps (no indent) is several times
+            # faster and the log is machine-read, not eyeballed raw.
+            log_debug = self.debug and self.logger.isEnabledFor(logging.DEBUG)
+            if log_debug:
                 self.logger.debug("=== LLM Request Payload ===")
                 self.logger.debug(
-                    json.dumps(request_payload, indent=2, ensure_ascii=False)
+                    json.dumps(request_payload, ensure_ascii=False)
                 )
                 self.logger.debug("=== End Request Payload ===")
 
-            response = self.client.chat.completions.create(**request_payload)
-
-            text = response.choices[0].message.content or ""
-            usage = response.usage
+            if stream:
+                request_payload["stream"] = True
+                # Ask for usage stats on the final chunk
+                request_payload["stream_options"] = {"include_usage": True}
+                response = self.client.chat.completions.create(
+                    **request_payload
+                )
+                text_parts: list[str] = []
+                usage = None
+                for chunk in response:
+                    if chunk.choices:
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            text_parts.append(delta)
+                            if on_chunk is not None:
+                                on_chunk(delta)
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                text = "".join(text_parts)
+            else:
+                response = self.client.chat.completions.create(
+                    **request_payload
+                )
+                text = response.choices[0].message.content or ""
+                usage = response.usage
 
             input_tokens = usage.prompt_tokens if usage else 0
             output_tokens = usage.completion_tokens if usage else 0
 
             # Log response payload in debug mode
-            if self.debug:
+            if log_debug:
                 response_payload = {
-                    "id": getattr(response, "id", None),
-                    "model": getattr(response, "model", None),
-                    "choices": [
-                        {
-                            "index": choice.index,
-                            "message": {
-                                "role": choice.message.role,
-                                "content": choice.message.content,
-                            },
-                            "finish_reason": choice.finish_reason,
-                        }
-                        for choice in response.choices
-                    ],
+                    "model": self.model,
+                    "streamed": stream,
+                    "content": text,
                     "usage": {
                         "prompt_tokens": input_tokens,
                         "completion_tokens": output_tokens,
@@ -153,7 +325,7 @@ class OpenAICompatibleClient(LLMClientBase):
                 }
                 self.logger.debug("=== LLM Response Payload ===")
                 self.logger.debug(
-                    json.dumps(response_payload, indent=2, ensure_ascii=False)
+                    json.dumps(response_payload, ensure_ascii=False)
                 )
                 self.logger.debug("=== End Response Payload ===")
 
@@ -180,3 +352,74 @@ class OpenAICompatibleClient(LLMClientBase):
                 success=False,
                 error=str(e),
             )
+
+    def complete_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+    ) -> list[LLMResponse]:
+        """Complete several prompts sharing one system prompt.
+
+        Consolidates the prompts into a single request (one network
+        round trip, the system prompt ingested once) and splits the
+        response on a separator marker. Falls back to the sequential
+        base implementation when the request fails or the model does
+        not produce the expected number of sections. Per-item token
+        counts are approximations: input split evenly, output split
+        proportionally to response length.
+
+        Args:
+            prompts: User prompts to complete, in order.
+            system_prompt: System instructions shared by all prompts.
+            max_tokens: Maximum tokens for the whole batched response
+                (None for unlimited).
+            temperature: Sampling temperature (0.0-1.0).
+
+        Returns:
+            One LLMResponse per prompt, in the same order.
+        """
+        if len(prompts) <= 1:
+            return super().complete_batch(
+                prompts, system_prompt, max_tokens, temperature
+            )
+
+        sep = self._BATCH_SEP
+        combined = (
+            f"Respond to each of the {len(prompts)} prompts below, in "
+            f"order. Separate the responses with a line containing "
+            f"exactly {sep} and nothing else.\n\n"
+            + f"\n{sep}\n".join(prompts)
+        )
+        response = self.complete(
+            combined, system_prompt, max_tokens, temperature, stream=False
+        )
+
+        parts = (
+            [part.strip() for part in response.text.split(sep)]
+            if response.success else []
+        )
+        if len(parts) != len(prompts):
+            if response.success:
+                self.logger.warning(
+                    f"Batch returned {len(parts)} sections for "
+                    f"{len(prompts)} prompts; retrying sequentially"
+                )
+            return super().complete_batch(
+                prompts, system_prompt, max_tokens, temperature
+            )
+
+        input_per_item = response.input_tokens // len(prompts)
+        total_chars = sum(len(part) for part in parts) or 1
+        return [
+            LLMResponse(
+                text=part,
+                model=response.model,
+                input_tokens=input_per_item,
+                output_tokens=response.output_tokens * len(part)
+                // total_chars,
+                success=True,
+            )
+            for part in parts
+        ]
@@ -9,17 +9,23 @@ Environment variables:
   CERBERAS_MODEL   - Model to use (default: llama3.1-8b)
 """
 
+import asyncio
+import atexit
+import bisect
 import curses
+import hashlib
+import select
+import sys
 import threading
+import time
 import os
 import logging
 import json
-from openai import OpenAI
+from collections import OrderedDict, deque
 from typing import Optional
-from logging.handlers import RotatingFileHandler
-from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
 import warnings
-from queue import Queue, Empty
 
 SYSTEM_PROMPT = """# Fiction Editing Agent
 
@@ -60,23 +66,161 @@ Return only the edited text. No explanations, no commentary, no questions. If a
 **Avoid:** Melodrama, overwritten description, "as you know Bob" dialogue, attention-seeking dialogue tags, over-explained emotions."""
 
 CONTEXT_SIZE = 2000
+RESPONSE_CACHE_SIZE = 128
+
+# The system message never changes, so build the dict once and reuse the
+# same object across requests. The cache key lets OpenAI-compatible
+# endpoints that support server-side prompt caching reuse the KV cache
+# for the static system prompt instead of reprocessing it every send.
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+_PROMPT_CACHE_KEY = hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest()[:32]
+
+# Singleton 1-char strings indexed by key code; non-printable codes map
+# to "". One index replaces the range check plus chr() allocation per
+# keystroke, which adds up on key repeat and paste bursts. 512 entries
+# cover curses KEY_ codes so no bounds branch is needed for them.
+_PRINTABLE = tuple(chr(i) if 32 <= i <= 126 else "" for i in range(512))
+
+
+class GapLine:
+    """Single editable line backed by a gap buffer.
+
+    Keeps a movable gap of free slots at the cursor so repeated inserts
+    and deletes at the same spot shift no text at all, instead of
+    rebuilding an O(line) string per keystroke. Reads (len, slicing,
+    str, comparison with str) behave like the plain string the rest of
+    the editor expects. Uses a list of 1-char strings rather than a
+    bytearray so non-ASCII response text round-trips unchanged.
+    """
+
+    __slots__ = ("_buf", "_gap_start", "_gap_end")
+    _MIN_GAP = 16
+
+    def __init__(self, text: str = ""):
+        self._buf = list(text) + [""] * self._MIN_GAP
+        self._gap_start = len(text)
+        self._gap_end = len(self._buf)
+
+    def __len__(self) -> int:
+        return len(self._buf) - (self._gap_end - self._gap_start)
+
+    def __str__(self) -> str:
+        return (
+            "".join(self._buf[:self._gap_start])
+            + "".join(self._buf[self._gap_end:])
+        )
+
+    def __repr__(self) -> str:
+        return f"GapLine({str(self)!r})"
+
+    def __getitem__(self, index):
+        # Reads go through the joined string; renders hit only visible
+        # lines and the wrap cache keeps this off the per-frame path
+        return str(self)[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, GapLine):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, (GapLine, str)):
+            return str(self) + str(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, str):
+            return other + str(self)
+        return NotImplemented
+
+    def __iadd__(self, other: str) -> "GapLine":
+        self.insert(len(self), str(other))
+        return self
+
+    def _move_gap(self, pos: int) -> None:
+        """Shift the gap so it starts at character position pos."""
+        buf = self._buf
+        gs, ge = self._gap_start, self._gap_end
+        if pos < gs:
+            n = gs - pos
+            buf[ge - n:ge] = buf[pos:gs]
+            self._gap_start, self._gap_end = pos, ge - n
+        elif pos > gs:
+            n = pos - gs
+            buf[gs:gs + n] = buf[ge:ge + n]
+            self._gap_start, self._gap_end = pos, ge + n
+
+    def insert(self, pos: int, text: str) -> None:
+        """Insert text at character position pos."""
+        self._move_gap(pos)
+        need = len(text) - (self._gap_end - self._gap_start)
+        if need > 0:
+            extra = max(need, self._MIN_GAP)
+            self._buf[self._gap_start:self._gap_start] = [""] * extra
+            self._gap_end += extra
+        self._buf[self._gap_start:self._gap_start + len(text)] = list(text)
+        self._gap_start += len(text)
+
+    def delete(self, pos: int) -> None:
+        """Delete the character at position pos."""
+        if 0 <= pos < len(self):
+            self._move_gap(pos)
+            self._gap_end += 1
+
+
+def _edit_line(lines: list, y: int) -> GapLine:
+    """Return lines[y] as a GapLine, converting in place on first edit.
+
+    Lines arriving from the API or file loads stay plain strings until
+    the user actually edits them.
+    """
+    line = lines[y]
+    if type(line) is not GapLine:
+        line = GapLine(line)
+        lines[y] = line
+    return line
 
 
 class JsonFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
-        log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
-        }
+        # Build the timestamp from record.created with strftime: no
+        # datetime object per record, and it reflects when the record
+        # was emitted, not when the listener got around to writing it
+        t = record.created
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t))
+        # Assemble the JSON by hand instead of json.dumps(dict): only the
+        # message and traceback can contain characters that need escaping,
+        # so those two go through json.dumps; levelname/module/funcName
+        # come from a controlled set and are interpolated directly
+        line = (
+            f'{{"timestamp": "{ts}.{int((t % 1) * 1e6):06d}+00:00",'
+            f' "level": "{record.levelname}",'
+            f' "message": {json.dumps(record.getMessage())},'
+            f' "module": "{record.module}",'
+            f' "function": "{record.funcName}",'
+            f' "line": {record.lineno}'
+        )
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_data)
+            exc = json.dumps(self.formatException(record.exc_info))
+            return f'{line}, "exception": {exc}}}'
+        return line + "}"
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler that passes records through unmodified.
+
+    The default prepare() pre-formats exceptions into the message so
+    records survive pickling; this queue never leaves the process, so
+    records go through intact and JsonFormatter keeps its separate
+    exception field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 def setup_logging() -> logging.Logger:
@@ -92,7 +236,14 @@ def setup_logging() -> logging.Logger:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(JsonFormatter())
-    logger.addHandler(file_handler)
+
+    # Formatting and disk writes happen on the listener thread, so a
+    # logger.info inside the render loop is just a queue put
+    log_queue: SimpleQueue = SimpleQueue()
+    logger.addHandler(_LocalQueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
 
     return logger
 
@@ -117,27 +268,58 @@ class FictionEditor:
         curses.init_pair(4, curses.COLOR_YELLOW, -1)  # Input border focused
         curses.init_pair(5, curses.COLOR_WHITE, -1)   # Dim border
 
+        # Bind the pair attributes once; curses.color_pair is a C call
+        # that every draw would otherwise repeat per frame
+        self._cp = tuple(curses.color_pair(i) for i in range(6))
+
         self.stdscr.nodelay(True)  # Non-blocking input
         self.stdscr.keypad(True)   # Enable special keys
 
-        # Initialize Cerberas client (OpenAI-compatible)
+        # Configure the Cerberas client (OpenAI-compatible). The env
+        # checks stay eager so a missing key still fails at startup, but
+        # importing openai pulls in httpx and pydantic — hundreds of ms —
+        # so the client itself is built lazily on the first send and the
+        # UI paints immediately
         try:
-            api_key = os.environ.get("CERBERAS_API_KEY")
-            if not api_key:
+            self._api_key = os.environ.get("CERBERAS_API_KEY")
+            if not self._api_key:
                 raise ValueError("CERBERAS_API_KEY environment variable not set")
             self.model = os.environ.get("CERBERAS_MODEL", "llama3.1-8b")
-            self.client = OpenAI(
-                base_url="https://api.cerebras.ai/v1",
-                api_key=api_key
-            )
-            logger.info(f"Cerberas client initialized, model: {self.model}")
+            self.client = None
+            logger.info("Cerberas client configured, model: %s", self.model)
         except Exception as e:
-            logger.error(f"Failed to initialize Cerberas client: {e}")
+            logger.error("Failed to configure Cerberas client: %s", e)
             raise
 
-        self.response_queue: Queue = Queue()
+        # Single background event loop for API calls. Requests are
+        # submitted from the UI thread with run_coroutine_threadsafe, so
+        # each send reuses this loop instead of spawning a new thread.
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever, daemon=True
+        )
+        self._loop_thread.start()
+        # Cap concurrent in-flight API calls
+        self.api_semaphore = asyncio.Semaphore(4)
+
+        # Single producer (the event loop thread) and single consumer
+        # (the main loop): deque append/popleft are atomic under the
+        # GIL, so no Queue lock is needed
+        self.response_queue: deque = deque()
         self.running = True
         self.processing = False
+        self.stream_active = False  # Mid-stream: chunks are being appended
+
+        # Wake pipe: the API task writes a byte after each queue put so
+        # the main loop can sleep in select() instead of polling
+        self._wake_rfd, self._wake_wfd = os.pipe()
+        os.set_blocking(self._wake_rfd, False)
+        os.set_blocking(self._wake_wfd, False)
+
+        # LRU of past responses keyed by request hash. Resending the
+        # same text with the same context skips the network round trip
+        # entirely and costs no tokens.
+        self.response_cache: OrderedDict[bytes, str] = OrderedDict()
 
         # Document state
         self.document_lines: list[str] = [""]
@@ -149,7 +331,7 @@ class FictionEditor:
         self.status_message: str = "Ready"
 
         # Spinner for API calls
-        self.spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        self.spinner_chars = tuple("⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
         self.spinner_idx: int = 0
 
         # File tracking
@@ -161,10 +343,35 @@ class FictionEditor:
         self.document_scroll: int = 0
         self.input_scroll: int = 0
 
+        # Damage tracking: panels redraw only when their state changed.
+        # All dirty at startup so the first frame paints everything.
+        self._doc_dirty = True
+        self._input_dirty = True
+        self._footer_dirty = True  # Covers header + footer chrome
+
+        # Incremental wrap layout: wrapped rows per source line plus a
+        # prefix sum of starting row indices. Character edits reflow
+        # only the touched line; structural edits rebuild everything.
+        self._line_rows: list[list[str]] = []
+        self._row_starts: list[int] = []
+        self._wrap_total = 0
+        self._wrap_dirty_lines: set[int] = set()
+        self._wrap_width = 0
+        self._wrap_cache_valid = False
+
+        # Cached tail of the joined document used as prompt context,
+        # cleared whenever the document mutates
+        self._doc_tail_cache: Optional[str] = None
+
+        # Back buffer of document rows as drawn last frame; rows that
+        # compare equal are not re-emitted. Emptied on resize.
+        self._prev_doc_rows: list[str] = []
+
         # Windows (created in resize handler)
         self.doc_win = None
         self.input_win = None
         self.create_windows()
+        self._last_dims = (curses.LINES, curses.COLS)
 
         logger.info("Fiction Editor application started")
 
@@ -172,14 +379,16 @@ class FictionEditor:
         """Wrap lines to fit within width."""
         wrapped = []
         for line in lines:
+            if type(line) is not str:  # Edited lines are GapLines
+                line = str(line)
             if len(line) <= width:
                 wrapped.append(line)
             else:
-                # Wrap long lines
-                while len(line) > width:
-                    wrapped.append(line[:width])
-                    line = line[width:]
-                wrapped.append(line)
+                # Slice by index instead of re-slicing the remainder, so
+                # a long line costs O(n) instead of O(n^2/width)
+                wrapped.extend(
+                    line[i:i + width] for i in range(0, len(line), width)
+                )
         return wrapped
 
     def create_windows(self):
@@ -197,9 +406,19 @@ class FictionEditor:
             self.input_win = curses.newwin(self.input_height, width, 1 + self.doc_height, 0)
             self.doc_win.keypad(True)
             self.input_win.keypad(True)
+            # Re-bind the hot row-write methods to the new windows
+            self._doc_addstr = self.doc_win.addstr
+            self._input_addstr = self.input_win.addstr
         except curses.error:
             pass
 
+        # New geometry invalidates everything
+        self._doc_dirty = True
+        self._input_dirty = True
+        self._footer_dirty = True
+        self._wrap_cache_valid = False
+        self._prev_doc_rows = []
+
     def draw_header(self):
         """Draw the header line."""
         height, width = self.stdscr.getmaxyx()
@@ -210,9 +429,9 @@ class FictionEditor:
         header = header.ljust(width)[:width]
 
         try:
-            self.stdscr.attron(curses.color_pair(1))
+            self.stdscr.attron(self._cp[1])
             self.stdscr.addstr(0, 0, header[:width-1])
-            self.stdscr.attroff(curses.color_pair(1))
+            self.stdscr.attroff(self._cp[1])
         except curses.error:
             pass
 
@@ -232,9 +451,9 @@ class FictionEditor:
         footer = footer.ljust(width)[:width]
 
         try:
-            self.stdscr.attron(curses.color_pair(2))
+            self.stdscr.attron(self._cp[2])
             self.stdscr.addstr(height - 1, 0, footer[:width-1])
-            self.stdscr.attroff(curses.color_pair(2))
+            self.stdscr.attroff(self._cp[2])
         except curses.error:
             pass
 
@@ -243,11 +462,12 @@ class FictionEditor:
         if not self.doc_win:
             return
 
-        self.doc_win.erase()
+        # No erase: rows are diffed against the previous frame below,
+        # and padded writes cover the whole interior
         height, width = self.doc_win.getmaxyx()
 
         # Draw border
-        color = curses.color_pair(3) if self.focus == "document" else curses.color_pair(5)
+        color = self._cp[3] if self.focus == "document" else self._cp[5]
         self.doc_win.attron(color)
         self.doc_win.border()
         self.doc_win.attroff(color)
@@ -256,11 +476,28 @@ class FictionEditor:
         content_height = height - 2
         content_width = width - 2
 
-        # Wrap document lines for display
-        wrapped_lines = self.wrap_lines(self.document_lines, content_width)
+        # Reflow: full rebuild on structural change or width change,
+        # otherwise only the lines edited since the last frame
+        if not self._wrap_cache_valid or self._wrap_width != content_width:
+            self._line_rows = [
+                self.wrap_lines([line], content_width)
+                for line in self.document_lines
+            ]
+            self._rebuild_row_starts()
+            self._wrap_width = content_width
+            self._wrap_cache_valid = True
+            self._wrap_dirty_lines.clear()
+        elif self._wrap_dirty_lines:
+            for y in self._wrap_dirty_lines:
+                if y < len(self._line_rows):
+                    self._line_rows[y] = self.wrap_lines(
+                        [self.document_lines[y]], content_width
+                    )
+            self._wrap_dirty_lines.clear()
+            self._rebuild_row_starts()
 
         # Title
-        total = len(wrapped_lines)
+        total = self._wrap_total
         is_empty = (self.document_lines == [""] or self.document_lines == [])
         if is_empty:
             title = " Document (empty) "
@@ -276,15 +513,37 @@ class FictionEditor:
             pass
 
         # Ensure scroll is valid
-        max_scroll = max(0, len(wrapped_lines) - content_height)
+        max_scroll = max(0, total - content_height)
         self.document_scroll = max(0, min(self.document_scroll, max_scroll))
 
+        # Collect the visible rows: bisect to the first on-screen source
+        # line, then walk forward, so the cost is O(content_height) no
+        # matter how large the document is
+        visible: list[str] = []
+        if self._row_starts and self.document_scroll < total:
+            li = bisect.bisect_right(self._row_starts, self.document_scroll) - 1
+            offset = self.document_scroll - self._row_starts[li]
+            while li < len(self._line_rows) and len(visible) < content_height:
+                rows = self._line_rows[li]
+                visible.extend(rows[offset:offset + content_height - len(visible)])
+                offset = 0
+                li += 1
+
+        # Emit only rows that differ from what was drawn last frame; a
+        # mostly-static window costs a border and a few comparisons
+        prev = self._prev_doc_rows
+        if len(prev) != content_height:
+            prev = self._prev_doc_rows = [None] * content_height
+        blank = " " * content_width
         for i in range(content_height):
-            line_idx = self.document_scroll + i
-            if line_idx < len(wrapped_lines):
-                line = wrapped_lines[line_idx]
+            if i < len(visible):
+                row = visible[i].ljust(content_width)
+            else:
+                row = blank
+            if row != prev[i]:
+                prev[i] = row
                 try:
-                    self.doc_win.addstr(i + 1, 1, line)
+                    self._doc_addstr(i + 1, 1, row)
                 except curses.error:
                     pass
 
@@ -296,12 +555,11 @@ class FictionEditor:
             if self.document_lines and self.doc_cursor_x > len(self.document_lines[self.doc_cursor_y]):
                 self.doc_cursor_x = len(self.document_lines[self.doc_cursor_y])
 
-            # Calculate screen position (account for wrapping)
-            screen_line = 0
-            for i in range(self.doc_cursor_y):
-                if i < len(self.document_lines):
-                    line_len = len(self.document_lines[i])
-                    screen_line += max(1, (line_len + content_width - 1) // content_width) if line_len > content_width else 1
+            # Calculate screen position from the row prefix sums
+            if self.doc_cursor_y < len(self._row_starts):
+                screen_line = self._row_starts[self.doc_cursor_y]
+            else:
+                screen_line = self._wrap_total
 
             # Add offset within current line due to wrapping
             cursor_in_line = self.doc_cursor_x // content_width
@@ -328,7 +586,7 @@ class FictionEditor:
         height, width = self.input_win.getmaxyx()
 
         # Draw border
-        color = curses.color_pair(4) if self.focus == "input" else curses.color_pair(5)
+        color = self._cp[4] if self.focus == "input" else self._cp[5]
         self.input_win.attron(color)
         self.input_win.border()
         self.input_win.attroff(color)
@@ -353,7 +611,7 @@ class FictionEditor:
             if line_idx < len(self.input_lines):
                 line = self.input_lines[line_idx][:content_width]
                 try:
-                    self.input_win.addstr(i + 1, 1, line)
+                    self._input_addstr(i + 1, 1, line)
                 except curses.error:
                     pass
 
@@ -370,18 +628,31 @@ class FictionEditor:
         self.input_win.noutrefresh()
 
     def refresh_all(self):
-        """Refresh all windows."""
-        self.stdscr.noutrefresh()
-        self.draw_header()
-        self.draw_footer()
-        self.stdscr.noutrefresh()
-        self.draw_document()
-        self.draw_input()
+        """Refresh windows whose state changed since the last frame."""
+        # Footer redraws while processing so the spinner keeps animating
+        if self._footer_dirty or self.processing:
+            self.draw_header()
+            self.draw_footer()
+            self.stdscr.noutrefresh()
+            self._footer_dirty = False
+            # Redrawing chrome moves the physical cursor; repaint the
+            # focused panel so the cursor lands back in it
+            if self.focus == "document":
+                self._doc_dirty = True
+            else:
+                self._input_dirty = True
+        if self._doc_dirty:
+            self.draw_document()
+            self._doc_dirty = False
+        if self._input_dirty:
+            self.draw_input()
+            self._input_dirty = False
         curses.doupdate()
 
     def get_input_text(self) -> str:
         """Get all input text as a single string."""
-        return "\n".join(self.input_lines)
+        # str() each line: edited lines are GapLines
+        return "\n".join(map(str, self.input_lines))
 
     def clear_input(self):
         """Clear the input buffer."""
@@ -396,14 +667,17 @@ class FictionEditor:
 
         if key == curses.KEY_BACKSPACE or key == 127 or key == 8:
             if self.input_cursor_x > 0:
-                line = self.input_lines[self.input_cursor_y]
-                self.input_lines[self.input_cursor_y] = line[:self.input_cursor_x-1] + line[self.input_cursor_x:]
+                _edit_line(self.input_lines, self.input_cursor_y).delete(self.input_cursor_x - 1)
                 self.input_cursor_x -= 1
                 self.modified = True
             elif self.input_cursor_y > 0:
                 # Join with previous line
                 prev_len = len(self.input_lines[self.input_cursor_y - 1])
-                self.input_lines[self.input_cursor_y - 1] += self.input_lines[self.input_cursor_y]
+                joined = (
+                    self.input_lines[self.input_cursor_y - 1]
+                    + self.input_lines[self.input_cursor_y]
+                )
+                self.input_lines[self.input_cursor_y - 1] = joined
                 del self.input_lines[self.input_cursor_y]
                 self.input_cursor_y -= 1
                 self.input_cursor_x = prev_len
@@ -413,9 +687,8 @@ class FictionEditor:
                     self.input_scroll = self.input_cursor_y
 
         elif key == curses.KEY_DC:  # Delete key
-            line = self.input_lines[self.input_cursor_y]
-            if self.input_cursor_x < len(line):
-                self.input_lines[self.input_cursor_y] = line[:self.input_cursor_x] + line[self.input_cursor_x+1:]
+            if self.input_cursor_x < len(self.input_lines[self.input_cursor_y]):
+                _edit_line(self.input_lines, self.input_cursor_y).delete(self.input_cursor_x)
                 self.modified = True
 
         elif key == curses.KEY_LEFT:
@@ -452,9 +725,8 @@ class FictionEditor:
             if self.input_cursor_y >= self.input_scroll + content_height:
                 self.input_scroll = self.input_cursor_y - content_height + 1
 
-        elif 32 <= key <= 126:  # Printable ASCII
-            line = self.input_lines[self.input_cursor_y]
-            self.input_lines[self.input_cursor_y] = line[:self.input_cursor_x] + chr(key) + line[self.input_cursor_x:]
+        elif 0 <= key < 512 and (ch := _PRINTABLE[key]):  # Printable ASCII
+            _edit_line(self.input_lines, self.input_cursor_y).insert(self.input_cursor_x, ch)
             self.input_cursor_x += 1
             self.modified = True
 
@@ -468,29 +740,39 @@ class FictionEditor:
 
         if key == curses.KEY_BACKSPACE or key == 127 or key == 8:
             if self.doc_cursor_x > 0:
-                line = self.document_lines[self.doc_cursor_y]
-                self.document_lines[self.doc_cursor_y] = line[:self.doc_cursor_x-1] + line[self.doc_cursor_x:]
+                _edit_line(self.document_lines, self.doc_cursor_y).delete(self.doc_cursor_x - 1)
                 self.doc_cursor_x -= 1
                 self.modified = True
+                self._invalidate_doc_caches(self.doc_cursor_y)
             elif self.doc_cursor_y > 0:
                 # Join with previous line
                 prev_len = len(self.document_lines[self.doc_cursor_y - 1])
-                self.document_lines[self.doc_cursor_y - 1] += self.document_lines[self.doc_cursor_y]
+                joined = (
+                    self.document_lines[self.doc_cursor_y - 1]
+                    + self.document_lines[self.doc_cursor_y]
+                )
+                self.document_lines[self.doc_cursor_y - 1] = joined
                 del self.document_lines[self.doc_cursor_y]
                 self.doc_cursor_y -= 1
                 self.doc_cursor_x = prev_len
                 self.modified = True
+                self._invalidate_doc_caches()
 
         elif key == curses.KEY_DC:  # Delete key
-            line = self.document_lines[self.doc_cursor_y]
-            if self.doc_cursor_x < len(line):
-                self.document_lines[self.doc_cursor_y] = line[:self.doc_cursor_x] + line[self.doc_cursor_x+1:]
+            if self.doc_cursor_x < len(self.document_lines[self.doc_cursor_y]):
+                _edit_line(self.document_lines, self.doc_cursor_y).delete(self.doc_cursor_x)
                 self.modified = True
+                self._invalidate_doc_caches(self.doc_cursor_y)
             elif self.doc_cursor_y < len(self.document_lines) - 1:
                 # Join with next line
-                self.document_lines[self.doc_cursor_y] += self.document_lines[self.doc_cursor_y + 1]
+                joined = (
+                    self.document_lines[self.doc_cursor_y]
+                    + self.document_lines[self.doc_cursor_y + 1]
+                )
+                self.document_lines[self.doc_cursor_y] = joined
                 del self.document_lines[self.doc_cursor_y + 1]
                 self.modified = True
+                self._invalidate_doc_caches()
 
         elif key == curses.KEY_LEFT:
             if self.doc_cursor_x > 0:
@@ -537,12 +819,13 @@ class FictionEditor:
             self.doc_cursor_y += 1
             self.doc_cursor_x = 0
             self.modified = True
+            self._invalidate_doc_caches()
 
-        elif 32 <= key <= 126:  # Printable ASCII
-            line = self.document_lines[self.doc_cursor_y]
-            self.document_lines[self.doc_cursor_y] = line[:self.doc_cursor_x] + chr(key) + line[self.doc_cursor_x:]
+        elif 0 <= key < 512 and (ch := _PRINTABLE[key]):  # Printable ASCII
+            _edit_line(self.document_lines, self.doc_cursor_y).insert(self.doc_cursor_x, ch)
             self.doc_cursor_x += 1
             self.modified = True
+            self._invalidate_doc_caches(self.doc_cursor_y)
 
     def prompt_for_filename(self) -> Optional[str]:
         """Prompt user for a filename."""
@@ -551,10 +834,10 @@ class FictionEditor:
         default = self.current_file or "document.md"
 
         # Draw prompt on footer line
-        self.stdscr.attron(curses.color_pair(1))
+        self.stdscr.attron(self._cp[1])
         self.stdscr.addstr(height - 1, 0, " " * (width - 1))
         self.stdscr.addstr(height - 1, 0, prompt)
-        self.stdscr.attroff(curses.color_pair(1))
+        self.stdscr.attroff(self._cp[1])
         self.stdscr.refresh()
 
         # Enable echo and blocking input temporarily
@@ -579,10 +862,10 @@ class FictionEditor:
         height, width = self.stdscr.getmaxyx()
         prompt = "Save before quitting? (y/n/c): "
 
-        self.stdscr.attron(curses.color_pair(1))
+        self.stdscr.attron(self._cp[1])
         self.stdscr.addstr(height - 1, 0, " " * (width - 1))
         self.stdscr.addstr(height - 1, 0, prompt)
-        self.stdscr.attroff(curses.color_pair(1))
+        self.stdscr.attroff(self._cp[1])
         self.stdscr.refresh()
 
         self.stdscr.nodelay(False)
@@ -606,120 +889,262 @@ class FictionEditor:
         if filename is None:
             return False
 
-        logger.info(f"Saving file: {filename}")
+        logger.info("Saving file: %s", filename)
         try:
             # Don't save if document is just empty placeholder
             if self.document_lines == [""]:
-                content = ""
+                payload = b""
             else:
-                content = "\n".join(self.document_lines)
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
+                # Encode per line and join the bytes: one binary write,
+                # no intermediate full-document string and no
+                # TextIOWrapper re-encoding pass over it
+                payload = b"\n".join(
+                    str(line).encode("utf-8") for line in self.document_lines
+                )
+            with open(filename, "wb") as f:
+                f.write(payload)
             self.current_file = filename
             self.modified = False
             self.status_message = f"Saved: {os.path.basename(filename)}"
-            logger.info(f"File saved: {filename}")
+            self._footer_dirty = True
+            logger.info("File saved: %s", filename)
             return True
         except Exception as e:
-            logger.error(f"Failed to save: {e}")
+            logger.error("Failed to save: %s", e)
             self.status_message = f"Save error: {e}"
+            self._footer_dirty = True
             return False
 
+    def _invalidate_doc_caches(self, line: Optional[int] = None):
+        """Document changed: wrapped view and context tail are stale.
+
+        With line given, only that source line is reflowed on the next
+        draw; without it (splits, joins, bulk appends) the whole layout
+        rebuilds.
+        """
+        self._doc_tail_cache = None
+        if line is None or not self._wrap_cache_valid:
+            self._wrap_cache_valid = False
+        else:
+            self._wrap_dirty_lines.add(line)
+
+    def _rebuild_row_starts(self):
+        """Recompute the prefix sum of wrapped row counts per line."""
+        starts = []
+        total = 0
+        for rows in self._line_rows:
+            starts.append(total)
+            total += len(rows)
+        self._row_starts = starts
+        self._wrap_total = total
+
     def get_context(self) -> tuple[str, str]:
         """Get preceding and subsequent text for context."""
-        doc_content = "\n".join(self.document_lines)
-        if not doc_content:
+        if self._doc_tail_cache is None:
+            # Join only enough trailing lines to cover CONTEXT_SIZE;
+            # earlier lines cannot reach the tail slice, so the cost is
+            # O(CONTEXT_SIZE) regardless of document length
+            parts = []
+            total = -1  # Offsets the newline counted with the first part
+            for line in reversed(self.document_lines):
+                s = str(line)
+                parts.append(s)
+                total += len(s) + 1
+                if total >= CONTEXT_SIZE:
+                    break
+            parts.reverse()
+            tail = "\n".join(parts)
+            self._doc_tail_cache = tail[-CONTEXT_SIZE:]
+        preceding = self._doc_tail_cache
+        if not preceding:
             return "", ""
-        preceding = doc_content[-CONTEXT_SIZE:] if len(doc_content) > CONTEXT_SIZE else doc_content
         return preceding, ""
 
     def build_prompt(self, text_to_edit: str) -> str:
         """Build the full prompt with context."""
         preceding, subsequent = self.get_context()
-        parts = []
+        # Concatenate the literal headers with + instead of formatting
+        # each section and joining: no intermediate parts list or
+        # per-section f-string allocations. The preceding segment comes
+        # memoized from get_context()
         if preceding:
-            parts.append(f"[PRECEDING TEXT]\n{preceding}")
-        parts.append(f"[TEXT TO EDIT]\n{text_to_edit}")
+            prompt = ("[PRECEDING TEXT]\n" + preceding
+                      + "\n\n[TEXT TO EDIT]\n" + text_to_edit)
+        else:
+            prompt = "[TEXT TO EDIT]\n" + text_to_edit
         if subsequent:
-            parts.append(f"[SUBSEQUENT TEXT]\n{subsequent}")
-        return "\n\n".join(parts)
+            prompt += "\n\n[SUBSEQUENT TEXT]\n" + subsequent
+        return prompt
+
+    def _ensure_client(self):
+        """Construct the AsyncOpenAI client on first use."""
+        if self.client is not None:
+            return
+        # Paint the status first; the import below blocks for the one
+        # send that pays the startup cost
+        self.status_message = "Loading client..."
+        self._footer_dirty = True
+        self.refresh_all()
+        from openai import AsyncOpenAI
+        self.client = AsyncOpenAI(
+            base_url="https://api.cerebras.ai/v1",
+            api_key=self._api_key
+        )
+        logger.info("Cerberas client initialized, model: %s", self.model)
 
     def send_to_api(self):
         """Send input text to Cerberas for editing."""
         input_content = self.get_input_text().strip()
         if not input_content:
             self.status_message = "Empty input"
+            self._footer_dirty = True
             return
 
-        logger.info(f"Sending to Cerberas: {len(input_content)} chars")
+        self._ensure_client()
+
+        logger.info("Sending to Cerberas: %d chars", len(input_content))
         self.processing = True
         self.status_message = "Sending to Cerberas..."
+        self._footer_dirty = True
 
-        thread = threading.Thread(target=self._api_call, args=(input_content,), daemon=True)
-        thread.start()
+        asyncio.run_coroutine_threadsafe(self._api_call(input_content), self.loop)
 
-    def _api_call(self, input_content: str):
-        """Make the API call (runs in separate thread)."""
+    def _queue_put(self, item: dict):
+        """Enqueue a response item and wake the main loop's select()."""
+        self.response_queue.append(item)
+        try:
+            os.write(self._wake_wfd, b"x")
+        except (BlockingIOError, OSError):
+            pass  # Pipe full: a wake-up is already pending
+
+    async def _api_call(self, input_content: str):
+        """Make the API call (runs on the background event loop)."""
         try:
             prompt = self.build_prompt(input_content)
-            logger.info(f"Starting API call to Cerberas ({self.model})")
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ]
-            )
 
-            response_text = response.choices[0].message.content
-            logger.info(f"API success: {len(response_text)} chars")
-            self.response_queue.put({"type": "response", "data": response_text})
+            # Cache hit: identical text with identical context was edited
+            # before, so return the stored response without a network call
+            cache_key = hashlib.sha256(
+                (SYSTEM_PROMPT + self.model + prompt).encode()
+            ).digest()
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.response_cache.move_to_end(cache_key)
+                logger.info("Response cache hit")
+                self._queue_put({"type": "response", "data": cached})
+                return
+
+            logger.info("Starting API call to Cerberas (%s)", self.model)
+
+            # Stream the completion so text appears as it is generated;
+            # perceived latency is time-to-first-token, not the full
+            # generation time
+            text_parts = []
+            async with self.api_semaphore:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    messages=[
+                        _SYSTEM_MSG,
+                        {"role": "user", "content": prompt}
+                    ],
+                    stream=True,
+                    extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY}
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        text_parts.append(delta)
+                        self._queue_put({"type": "chunk", "data": delta})
+
+            response_text = "".join(text_parts)
+            logger.info("API success: %d chars", len(response_text))
+            self.response_cache[cache_key] = response_text
+            if len(self.response_cache) > RESPONSE_CACHE_SIZE:
+                self.response_cache.popitem(last=False)
+            self._queue_put({"type": "done"})
 
         except Exception as e:
-            logger.error(f"API error: {e}")
-            self.response_queue.put({"type": "error", "data": str(e)})
+            logger.error("API error: %s", e)
+            self._queue_put({"type": "error", "data": str(e)})
 
     def process_queue(self):
         """Process items from the response queue."""
-        try:
-            while True:
-                item = self.response_queue.get_nowait()
-                if item["type"] == "response":
-                    # Add response to document
+        q = self.response_queue
+        while q:
+            item = q.popleft()
+            if item["type"] == "chunk":
+                if not self.stream_active:
+                    # First chunk: open a new paragraph for the response
                     if self.document_lines and self.document_lines != [""]:
                         self.document_lines.append("")
-                    response_lines = item["data"].split("\n")
-                    if self.document_lines == [""]:
-                        self.document_lines = response_lines
-                    else:
-                        self.document_lines.extend(response_lines)
-                    # Move cursor to end
-                    self.doc_cursor_y = len(self.document_lines) - 1
-                    self.doc_cursor_x = len(self.document_lines[self.doc_cursor_y])
-                    # Scroll to bottom
-                    content_height = self.doc_height - 2
-                    self.document_scroll = max(0, len(self.document_lines) - content_height)
                     self.clear_input()
-                    self.modified = True
-                    self.status_message = "Ready"
-                elif item["type"] == "error":
-                    self.status_message = f"Error: {item['data'][:50]}"
+                    self.stream_active = True
+                    self.status_message = "Receiving..."
+                # Append the delta to the last line, splitting on
+                # embedded newlines
+                delta_lines = item["data"].split("\n")
+                self.document_lines[-1] += delta_lines[0]
+                self.document_lines.extend(delta_lines[1:])
+                self._scroll_doc_to_end()
+                self.modified = True
+                self._doc_dirty = True
+                self._input_dirty = True
+                self._footer_dirty = True
+                self._invalidate_doc_caches()
+            elif item["type"] == "response":
+                # Complete response in one piece (cache hits)
+                if self.document_lines and self.document_lines != [""]:
+                    self.document_lines.append("")
+                response_lines = item["data"].split("\n")
+                if self.document_lines == [""]:
+                    self.document_lines = response_lines
+                else:
+                    self.document_lines.extend(response_lines)
+                self._scroll_doc_to_end()
+                self.clear_input()
+                self.modified = True
                 self.processing = False
-        except Empty:
-            pass
+                self.status_message = "Ready"
+                self._doc_dirty = True
+                self._input_dirty = True
+                self._footer_dirty = True
+                self._invalidate_doc_caches()
+            elif item["type"] == "done":
+                self.stream_active = False
+                self.processing = False
+                self.status_message = "Ready"
+                self._footer_dirty = True
+            elif item["type"] == "error":
+                self.stream_active = False
+                self.processing = False
+                self.status_message = f"Error: {item['data'][:50]}"
+                self._footer_dirty = True
+
+    def _scroll_doc_to_end(self):
+        """Move the document cursor and scroll to the end of the buffer."""
+        self.doc_cursor_y = len(self.document_lines) - 1
+        self.doc_cursor_x = len(self.document_lines[self.doc_cursor_y])
+        content_height = self.doc_height - 2
+        self.document_scroll = max(0, len(self.document_lines) - content_height)
 
     def run(self):
         """Main application loop."""
         logger.info("Starting main loop")
 
         while self.running:
-            # Handle resize
+            # Handle resize. is_term_resized keeps returning true until
+            # update_lines_cols takes effect, so gate the expensive
+            # window rebuild on the dimensions actually changing since
+            # the last build. No stdscr.clear(): create_windows resets
+            # the back buffers and dirty flags, which repaints everything
             if curses.is_term_resized(curses.LINES, curses.COLS):
                 curses.update_lines_cols()
+            if (curses.LINES, curses.COLS) != self._last_dims:
+                self._last_dims = (curses.LINES, curses.COLS)
                 self.create_windows()
-                self.stdscr.clear()
 
             # Process API responses
             self.process_queue()
@@ -727,6 +1152,22 @@ class FictionEditor:
             # Draw UI
             self.refresh_all()
 
+            # Sleep until a keystroke or a queue wake-up instead of
+            # polling. The timeout keeps the spinner animating while
+            # processing and bounds how stale a missed SIGWINCH can be.
+            timeout = 0.25 if self.processing else 0.5
+            try:
+                ready, _, _ = select.select(
+                    [sys.stdin, self._wake_rfd], [], [], timeout
+                )
+            except (OSError, select.error):
+                ready = []
+            if self._wake_rfd in ready:
+                try:
+                    os.read(self._wake_rfd, 4096)  # Drain wake bytes
+                except OSError:
+                    pass
+
             # Handle input
             try:
                 key = self.stdscr.getch()
@@ -734,39 +1175,96 @@ class FictionEditor:
                 key = -1
 
             if key == -1:
-                curses.napms(50)  # Sleep 50ms if no input
                 continue
 
-            # Global keys
-            if key == 5:  # Ctrl+E
-                self.focus = "document" if self.focus == "input" else "input"
-
-            elif key == 17:  # Ctrl+Q
-                if self.modified:
-                    choice = self.prompt_save_before_quit()
-                    if choice == 'y':
-                        self.save_file()
-                        self.running = False
-                    elif choice == 'n':
-                        self.running = False
-                    # else cancel, continue
+            # Drain queued keys (pastes, key repeat) so a burst is
+            # handled with a single redraw instead of one per key
+            keys = [key]
+            while len(keys) < 4096:
+                try:
+                    k = self.stdscr.getch()
+                except curses.error:
+                    break
+                if k == -1:
+                    break
+                keys.append(k)
+
+            i = 0
+            n = len(keys)
+            while i < n and self.running:
+                k = keys[i]
+                if 0 <= k < 512 and _PRINTABLE[k]:
+                    # Coalesce a printable run into one buffer insert
+                    j = i + 1
+                    while j < n and 0 <= keys[j] < 512 and _PRINTABLE[keys[j]]:
+                        j += 1
+                    self._insert_text(
+                        "".join(_PRINTABLE[c] for c in keys[i:j])
+                    )
+                    i = j
                 else:
-                    self.running = False
+                    self._dispatch_key(k)
+                    i += 1
 
-            elif key == 19:  # Ctrl+S
-                self.save_file()
+        # Stop the background event loop; the daemon thread exits with it
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        logger.info("Application shutdown")
+
+    def _insert_text(self, text: str):
+        """Insert a run of printable characters at the focused cursor."""
+        if self.focus == "input":
+            _edit_line(self.input_lines, self.input_cursor_y).insert(
+                self.input_cursor_x, text
+            )
+            self.input_cursor_x += len(text)
+            self._input_dirty = True
+        else:
+            _edit_line(self.document_lines, self.doc_cursor_y).insert(
+                self.doc_cursor_x, text
+            )
+            self.doc_cursor_x += len(text)
+            self._doc_dirty = True
+            self._invalidate_doc_caches(self.doc_cursor_y)
+        self.modified = True
+
+    def _dispatch_key(self, key: int):
+        """Handle a single non-printable key."""
+        # Global keys
+        if key == 5:  # Ctrl+E
+            self.focus = "document" if self.focus == "input" else "input"
+            # Border colors and the header focus label both change
+            self._doc_dirty = True
+            self._input_dirty = True
+            self._footer_dirty = True
+
+        elif key == 17:  # Ctrl+Q
+            if self.modified:
+                choice = self.prompt_save_before_quit()
+                self._footer_dirty = True  # Prompt overwrote the footer
+                if choice == 'y':
+                    self.save_file()
+                    self.running = False
+                elif choice == 'n':
+                    self.running = False
+                # else cancel, continue
+            else:
+                self.running = False
 
-            elif key == 4:  # Ctrl+D - send to API
-                if not self.processing:
-                    self.send_to_api()
+        elif key == 19:  # Ctrl+S
+            self.save_file()
 
-            # Focus-specific keys
-            elif self.focus == "input":
-                self.handle_input_key(key)
-            elif self.focus == "document":
-                self.handle_document_key(key)
+        elif key == 4:  # Ctrl+D - send to API
+            if not self.processing:
+                self.send_to_api()
 
-        logger.info("Application shutdown")
+        # Focus-specific keys (any key may move the cursor, so the
+        # focused panel always repaints)
+        elif self.focus == "input":
+            self.handle_input_key(key)
+            self._input_dirty = True
+        elif self.focus == "document":
+            self.handle_document_key(key)
+            self._doc_dirty = True
 
 
 def main(stdscr):
@@ -783,7 +1281,7 @@ if __name__ == "__main__":
     try:
         curses.wrapper(main)
     except Exception as e:
-        logger.critical(f"Fatal error: {e}", exc_info=True)
+        logger.critical("Fatal error: %s", e, exc_info=True)
         raise
     finally:
         logger.info("Fiction Editor shutdown")